@@ -0,0 +1,77 @@
+"""
+Counts the amount of pygame.Surface objects which are allocated while redrawing widgets.
+
+Every scenario changes a widget in a way that requires it to be redrawn (scrolling, typing, changing text) and then calls Buttons.Draw.
+The amount of surfaces made by the Surface constructor, Surface.copy/subsurface, Font.render and pygame.transform is reported per redraw.
+
+Usage: python benchmarks/surface_allocations.py [frames]
+"""
+import os
+import sys
+import time
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = ""
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import pygame
+pygame.init()
+screen = pygame.display.set_mode((800, 600))
+
+allocations = 0
+
+class CountingSurface(pygame.Surface):
+    """
+    pygame.Surface, which counts every time it is constructed.
+    """
+    def __init__(self, *args, **kwargs):
+        global allocations
+        allocations += 1
+        super().__init__(*args, **kwargs)
+
+#Surfaces made by C functions do not call the constructor, so these are counted using a profiler.
+SURFACE_FUNCTIONS = {"copy", "subsurface", "convert", "convert_alpha", "render", "scale", "smoothscale", "rotate", "flip", "rotozoom", "scale_by", "smoothscale_by"}
+
+def profiler(frame, event, arg):
+    global allocations
+    if event == "c_call" and arg.__name__ in SURFACE_FUNCTIONS:
+        owner = getattr(arg, "__self__", None)
+        if isinstance(owner, (pygame.Surface, pygame.font.Font)) or getattr(arg, "__module__", None) == "pygame.transform":
+            allocations += 1
+
+pygame.Surface = CountingSurface
+
+from pygbuttons import Buttons, Button, TextBox, Text
+
+
+def measure(name, group, change, frames):
+    global allocations
+    Buttons.Draw(screen, group)
+    allocations = 0
+    start = time.perf_counter()
+    sys.setprofile(profiler)
+    for i in range(frames):
+        change(i)
+        Buttons.Draw(screen, group)
+    sys.setprofile(None)
+    duration = time.perf_counter() - start
+    print(f"{name:<20}{allocations / frames:>8.2f} surfaces/frame{duration / frames * 1e6:>10.1f} us/frame (profiled)")
+
+
+def main(frames = 500):
+    button = Button((10, 10), (200, 50), text = "Button", group = "button")
+    text_box = TextBox((10, 70), (200, 40), hint = "Type here", group = "text_box")
+    text = Text((250, 10), (300, 300), text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 40, scroll_bar = 2, group = "text")
+
+    def scroll(i):
+        text.scrolled = (i * 7) % 300
+    def type_text(i):
+        text_box.text = "Some text" + "x" * (i % 20)
+    def change_text(i):
+        button.text = f"Button {i % 10}"
+
+    for name, group, change in (("Text scroll", "text", scroll), ("TextBox typing", "text_box", type_text), ("Button text", "button", change_text)):
+        measure(name, group, change, frames)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
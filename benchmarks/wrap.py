@@ -0,0 +1,65 @@
+"""
+Measures how long Text takes to wrap a 1 MB document into lines, at several widths.
+
+The document consists of paragraphs of very different lengths (from a few words to a single paragraph of 100 kB), built from a fixed vocabulary.
+For every width, the time of Text.Build_lines is reported, both for the first wrap and for wrapping again after scaling (which invalidates all lines).
+
+Usage: python benchmarks/wrap.py [size_in_bytes]
+"""
+import os
+import sys
+import time
+import random
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = ""
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import pygame
+pygame.init()
+screen = pygame.display.set_mode((100, 100))
+
+from pygbuttons import Buttons, Text
+
+
+WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore et dolore magna aliqua "
+         "Ut enim ad minim veniam quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo consequat 0123456789 "
+         "a I to of AVA WAVE Typography, pneumonoultramicroscopicsilicovolcanoconiosis").split(" ")
+
+def make_document(size, seed = 0):
+    """
+    Returns a document of (roughly) size characters, with paragraphs of very different lengths.
+    """
+    rng = random.Random(seed)
+    paragraphs = []
+    length = 0
+    #One huge paragraph, to show the behaviour for a single long paragraph.
+    paragraph_lengths = [min(size // 10, 100000)]
+    while length < size:
+        paragraph_length = paragraph_lengths.pop() if paragraph_lengths else rng.choice((20, 80, 400, 2000))
+        paragraph = " ".join(rng.choice(WORDS) for _ in range(paragraph_length // 6))
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 1
+    return "\n".join(paragraphs)
+
+
+def main(size = 1000000):
+    document = make_document(size)
+    print(f"Document: {len(document) / 1e6:.2f} MB, {document.count(chr(10)) + 1} paragraphs")
+    for width in (100, 300, 800, 2000):
+        text = Text((0, 0), (width, 200))
+        text.text = document
+        start = time.perf_counter()
+        text.Build_lines()
+        first = time.perf_counter() - start
+
+        #Scaling changes the font and the available width, so everything has to be wrapped again.
+        Buttons.Scale(1.25, text, relative_scale = False)
+        start = time.perf_counter()
+        text.Build_lines()
+        rescaled = time.perf_counter() - start
+        print(f"width {width:>5} px: {len(text.lines):>7} lines, wrap {first:>7.3f} s, after scaling {rescaled:>7.3f} s")
+        text.Delete()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -4,8 +4,11 @@ import pygame
 
 from .Control import Buttons
 from .utils.WeakCache import weak_cache
+from .utils.LRUCache import LRUCache
+from .utils.FontMetrics import FontMetrics
 
 import math
+import weakref
 
 pygame.font.init() #Required to set a font
 
@@ -28,6 +31,12 @@ class ButtonBase():
     *.get_scaled_rect() - Get a pygame.Rect object for the Button at its current scale.
     *.Add_to_group(group) - Add the Button on which this is called to the given group(s).
     *.Remove_from_group(group) - Removes the Button on which this function is called from the provided group(s).
+    *.Force_update() - Re-render the Button. Required after changing a surface used by the Button (e.g. as its background) in-place, as surfaces are only scaled once for every size.
+
+    Memory usage:
+    All buttons store their attributes in __slots__. Measured with tracemalloc (CPython 3.11, pygame 2.6), a single instance (including its entries in all internal registries) takes roughly:
+    Button: 2.1 kB, TextBox: 2.0 kB, Text: 2.1 kB (without text), Slider: 3.9 kB (including its slider), DropdownBox: 8.4 kB (with one option, plus about 1.8 kB per extra option).
+    This excludes the pixel data of the surfaces of the button, which takes 4 bytes per (scaled) pixel.
     """
     #Flags determining whether callbacks should be made and update_flags should be set.
     #Can be set using Buttons.Callbacks() and Buttons.Update_flags()
@@ -37,9 +46,23 @@ class ButtonBase():
     min_scale = 0.05
     max_scale = 5
 
+    actions = [] #The actions (e.g. "LMB_down") a type of button can perform. Defined by each sub-class.
+    #All state of a button is stored in slots, which are a lot smaller than a full __dict__. Every sub-class defines slots for its own attributes.
+    #__dict__ is still included (but only created when it is actually used), such that e.g. min_scale can still be set for a single button, and custom attributes can still be added.
+    __slots__ = ("__font", "__font_name", "__font_size", "__functions", "__height", "__left", "__scale", "__text_colour", "__top", "__width",
+                 "__scaled_rect", "__true_size", "__middle", "__scaled_topleft",
+                 "children", "groups", "independent", "root", "style", "surface", "updated", "__dict__", "__weakref__")
+    smoothscale = False #If True, surface backgrounds are scaled using pygame.transform.smoothscale (higher quality), instead of pygame.transform.scale.
+    convert_surfaces = False #If True, surfaces are converted to the pixel format of the display. Set using Buttons.Convert_surfaces().
+
+    _surface_cache = LRUCache(256) #Solid colour backgrounds (including borders) shared between all buttons. See Make_background.
+    _scaled_cache = LRUCache(64) #Scaled versions of surface backgrounds, shared between all buttons. See _scaled_surface.
+    _text_cache = LRUCache(512) #Rendered text, shared between all buttons. See Make_text_surface.
+
     def __init__(self, pos, size, font_name = pygame.font.get_default_font(), font_size = 22, groups = None, root = None, independent = False):
         #Tasks that are the same for all sub-classes
         self.updated = True
+        self.__scaled_rect = None
         self.children = []
         self.scale = 1
         self.groups = []
@@ -53,8 +76,11 @@ class ButtonBase():
         self.Add_to_group(groups)
         self.root = self if root is None else root
         if not independent:
-            Buttons.list_all.append(self)
+            Buttons.list_all[self] = None
+            Buttons._version += 1
         self.independent = independent
+        Buttons._index.insert(self, self._index_rect())
+        Buttons._Register(self)
 
     def __str__(self):
         return f"{type(self).__name__} object"
@@ -79,10 +105,12 @@ class ButtonBase():
             if grp in Buttons.groups:
                 #If the group exists, add self to the group, unless self is already in this group.
                 if not self in Buttons.groups[grp]:
-                    Buttons.groups[grp].append(self)
-            #If the group doesn't exist, make a new group with self as the first list entry.
+                    Buttons.groups[grp][self] = None
+                    Buttons._version += 1
+            #If the group doesn't exist, make a new group with self as the first entry.
             else:
-                Buttons.groups[grp] = [self]
+                Buttons.groups[grp] = {self: None}
+                Buttons._version += 1
 
             #Track the joined groups in the buttons' own groups list
             if grp not in self.groups:
@@ -95,15 +123,23 @@ class ButtonBase():
             if grp in self.groups:
                 self.groups.remove(grp)
             if self in Buttons.groups[grp]:
-                Buttons.groups[grp].remove(self)
+                del Buttons.groups[grp][self]
+                Buttons._version += 1
 
     def Delete(self):
+        """
+        Removes the button (and all buttons it consists of) from all groups and all internal registries, such that it is no longer drawn or updated.
+        """
+        for child in self.children:
+            child.Delete()
         for group in self.groups:
-            if self in Buttons.groups[group]:
-                Buttons.groups[group].remove(self)
+            Buttons.groups[group].pop(self, None)
         self.groups.clear()
-        if not self.independent and self in Buttons.list_all:
-            Buttons.list_all.remove(self)
+        Buttons.list_all.pop(self, None)
+        Buttons._version += 1
+        Buttons._index.remove(self)
+        Buttons._active.discard(self)
+        Buttons._Unregister(weakref.ref(self))
 
     def Set_lock(self, claim = True):
         """
@@ -111,6 +147,7 @@ class ButtonBase():
         If claim = True, automatically set Buttons.input_claim as well.
         """
         Buttons.input_processed = True
+        Buttons._active.add(self)
         if not Buttons._input_lock and not self.independent:
             Buttons._input_lock = self
         if claim:
@@ -122,6 +159,7 @@ class ButtonBase():
         If claim = True, automatically set Buttons.input_claim as well.
         """
         Buttons.input_processed = True
+        Buttons._active.discard(self)
         if self is Buttons._input_lock and not self.independent:
             Buttons._input_lock = None
         if claim:
@@ -138,13 +176,13 @@ class ButtonBase():
         Tests whether a position is within the current (main) button.
         """
         #Test whether the pos input is valid
-        position = self.Verify_iterable(position, 2)
+        if Buttons.validate:
+            position = self.Verify_iterable(position, 2)
+        x, y = position
+        left, top, right, bottom = self.__scaled_rect or self.__update_geometry()
         #If the position is within the corners. Note: Top and left have <=, whereas botom and right have < checks.
         #This is because the bottom / right values are actually just outside of the boxs' actual position
-        if self.scaled(self.left) <= position[0] < self.scaled(self.right) and self.scaled(self.top) <= position[1] < self.scaled(self.bottom):
-            return True
-        else:
-            return False
+        return left <= x < right and top <= y < bottom
 
     @staticmethod
     def is_within(position, topleft, bottomright):
@@ -185,29 +223,117 @@ class ButtonBase():
         #Set the background surface for the button. If one is provided, use
         # that one. Otherwise, make a new one with a solid color as given.
         if isinstance(inp, pygame.Surface):
-            return pygame.transform.scale(inp, size)
+            #The scaled surface is already converted to the display format (if required)
+            return self._scaled_surface(inp, size).copy()
         elif inp is None:
-            return pygame.Surface(size, pygame.SRCALPHA)
+            return self._display_format(pygame.Surface(size, pygame.SRCALPHA))
         elif hasattr(inp, "__call__"):
-            return inp()
+            return self._display_format(inp())
         elif hasattr(inp[0], "__call__"): #If it is a tuple/list iterable with a function as its first item
-            return inp[0](*(arg if arg != "*self*" else self for arg in inp[1:]))
+            return self._display_format(inp[0](*(arg if arg != "*self*" else self for arg in inp[1:])))
         else:
-            if isinstance(self.style, int):
-                corner_radius = max(0, self.scaled(self.style))
-            elif self.style.lower() == "square":
-                corner_radius = 0
-            elif self.style.lower() == "round":
-                corner_radius = min(size)
-            elif self.style.lower() == "smooth":
-                corner_radius = self.scaled(12)
-            else:
-                raise ValueError(f"Invalid style value {self.style}")
-
             surface = pygame.Surface(size, pygame.SRCALPHA)
-            pygame.draw.rect(surface, inp, ((0, 0), size), border_radius = corner_radius)
+            pygame.draw.rect(surface, inp, ((0, 0), size), border_radius = self._corner_radius(size))
+            return self._display_format(surface)
+
+    def Make_background(self, inp, *borders):
+        """
+        Makes the background surface of the button (see Make_background_surface), with all given borders (see Draw_border) drawn on top. Borders that are None are skipped.
+        Solid colour backgrounds are cached and shared between all buttons with the same colour, size, style and borders. A copy is returned, so the surface can safely be drawn onto.
+        """
+        borders = [border for border in borders if border]
+        if not isinstance(inp, (tuple, list)) or hasattr(inp[0], "__call__"):
+            #Functions are not cached, as they can produce a different result each time. Surfaces are only cached in their scaled form (see _scaled_surface).
+            surface = self.Make_background_surface(inp)
+            for border in borders:
+                self.Draw_border(surface, *border)
             return surface
 
+        size = self.true_size
+        key = (tuple(inp), size, self._corner_radius(size), tuple((tuple(colour), self.scaled(width), self.scaled(offset), self._corner_radius(size, self.scaled(offset))) for colour, width, offset in borders))
+        surface = self._surface_cache.get(key)
+        if surface is None:
+            surface = self.Make_background_surface(inp)
+            for border in borders:
+                self.Draw_border(surface, *border)
+            self._surface_cache.set(key, surface)
+        return surface.copy()
+
+    def Make_text_surface(self, text, colour, rotation = 0):
+        """
+        Renders the given text (anti-aliased) in the font of the button, optionally rotated by rotation degrees (counter-clockwise).
+        Rendered text is cached and shared between all buttons, so identical text (e.g. the same option in multiple DropdownBoxes) is only rendered once.
+        Note: The returned surface is shared, and should therefore not be drawn onto.
+        """
+        key = (self.font, text, tuple(colour), True, rotation)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self.font.render(text, True, colour)
+            if rotation:
+                surface = pygame.transform.rotate(surface, rotation)
+            surface = self._display_format(surface)
+            self._text_cache.set(key, surface)
+        return surface
+
+    def _scaled_surface(self, surface, size):
+        """
+        Returns the given surface scaled to size. The result is cached, so each surface only has to be scaled once for every size (and scaling mode).
+        Note: The returned surface is shared between all buttons, and should therefore not be drawn onto. Changes made to the original surface in-place are only picked up after Buttons.Force_update is called for the button (see _Forget_scaled).
+        """
+        size = tuple(size)
+        key = (surface, size, self.smoothscale)
+        scaled = self._scaled_cache.get(key)
+        if scaled is None:
+            #smoothscale only supports 24 and 32 bit surfaces
+            if self.smoothscale and surface.get_bitsize() in (24, 32):
+                scaled = pygame.transform.smoothscale(surface, size)
+            else:
+                scaled = pygame.transform.scale(surface, size)
+            scaled = self._display_format(scaled)
+            self._scaled_cache.set(key, scaled)
+        return scaled
+
+    def _Forget_scaled(self):
+        """
+        Removes the cached scaled versions (see _scaled_surface) of all surfaces used by the button and its children (e.g. a surface given as bg), such that changes made to them in-place are picked up when it is rendered again.
+        """
+        buttons = [self]
+        surfaces = set()
+        while buttons:
+            button = buttons.pop()
+            buttons.extend(button.children)
+            names = [name for cls in type(button).__mro__ for name in getattr(cls, "__slots__", ()) if not name.startswith("__")]
+            values = [getattr(button, name, None) for name in names] + list(getattr(button, "__dict__", {}).values())
+            surfaces.update(id(value) for value in values if isinstance(value, pygame.Surface))
+        for key in self._scaled_cache.keys():
+            if id(key[0]) in surfaces:
+                self._scaled_cache.remove(key)
+
+    def _display_format(self, surface):
+        """
+        Returns a copy of the surface converted to the pixel format of the display (keeping per-pixel alpha) if convert_surfaces is set, so blitting it onto the screen is faster.
+        Returns the surface itself if convert_surfaces is not set, or if there is no display.
+        """
+        if self.convert_surfaces and pygame.display.get_surface() is not None:
+            return surface.convert_alpha()
+        return surface
+
+    def _corner_radius(self, size, offset = 0):
+        """
+        Returns the (scaled) radius of the corners of a surface of the given size, for the style of the button.
+        offset: int - The (scaled) distance by which the corners lie inside of the surface (e.g. for a border with an offset).
+        """
+        if isinstance(self.style, int):
+            return max(0, self.scaled(self.style) - offset)
+        elif self.style.lower() == "square":
+            return 0
+        elif self.style.lower() == "round":
+            return min(size)
+        elif self.style.lower() == "smooth":
+            return max(0, self.scaled(12) - offset)
+        else:
+            raise ValueError(f"Invalid style value {self.style}")
+
 
     def Draw_border(self, surface, colour, border_width = 1, border_offset = 0, custom_size = None):
         """
@@ -219,19 +345,11 @@ class ButtonBase():
         if not border_width: #If after scaling, the border width is 0, don't try to draw anything, as doing so would colour the entire button.
             return
 
-        style = self.style
         if custom_size:
             size = custom_size
         else:
             size = self.true_size
-        if isinstance(style, int):
-            corner_radius = max(0, self.scaled(style) - border_offset)
-        elif style.lower() == "square":
-            corner_radius = 0
-        elif style.lower() == "round":
-            corner_radius = min(size)
-        elif style.lower() == "smooth":
-            corner_radius = max(0, self.scaled(12) - border_offset)
+        corner_radius = self._corner_radius(size, border_offset)
 
         pygame.draw.rect(surface, colour, (2*(border_offset,), self.offset(size, 2*(border_offset,), (-2, -2))), border_width, corner_radius)
 
@@ -240,7 +358,10 @@ class ButtonBase():
     def Verify_iterable(value, length = 2, data_types = None):
         """
         A function that verifies whether a given iterable has the required length, and whether all items in the iterable are of the correct types.
+        If Buttons.validate is False, the value is assumed to be correct, and is returned as a tuple straight away.
         """
+        if not Buttons.validate:
+            return value if type(value) is tuple else tuple(value)
         if not hasattr(value, "__iter__"):
             raise ValueError("Given value is not iterable")
         value_iterator = value.__iter__()
@@ -271,6 +392,8 @@ class ButtonBase():
         """
         Verifies whether a colour is in the correct format, and within the right range of values.
         """
+        if not Buttons.validate:
+            return value if type(value) is tuple else tuple(value)
         value = cls.Verify_iterable(value, 3, int)
         if all(0 <= i <= 255 for i in value):
             return value
@@ -323,11 +446,35 @@ class ButtonBase():
     def Force_update(self):
         """
         A function that forces a button to get updated. Can be used when an attribute is changed which does not directly cause it to update.
+        This includes changes made in-place to a surface used by the button (e.g. as its background), as any cached scaled versions of its surfaces are dropped as well.
         """
+        self._Forget_scaled()
         #Set the updated parameter
         self.updated = True
-        #Draw the button to make sure the button surface is updated too.
-        self.Draw(pygame.Surface((1,1)))
+        #Render the button to make sure the button surface is updated too.
+        self.Render()
+
+
+    def Draw(self, screen, pos = None):
+        """
+        Draw the button to the screen.
+        If pos is given, the button is drawn at that (scaled) position, instead of at its own position.
+        """
+        self.Render()
+        screen.blits(self.get_blits(pos), doreturn = False)
+
+    def Render(self):
+        """
+        (Re-)builds the surface(s) of the button, if required. Called automatically when the button is drawn.
+        """
+        pass
+
+    def get_blits(self, pos = None):
+        """
+        Returns a list of (surface, position) or (surface, position, area) tuples which together draw the button onto a screen, like the sequence for pygame.Surface.blits. The surfaces should be up to date (see *.Render()).
+        If pos is given, the button is drawn at that (scaled) position, instead of at its own position.
+        """
+        return []
 
 
     @staticmethod
@@ -346,9 +493,11 @@ class ButtonBase():
     @scale.setter
     def scale(self, value):
         self.__scale = value
+        self.__scaled_rect = None
         self.updated = True
         for child in self.children:
             child.scale = value
+        self._reindex()
 
 
     def _move(self, value):
@@ -364,6 +513,13 @@ class ButtonBase():
         #Return the font object.
         return self.__font
 
+    @property
+    def metrics(self):
+        """
+        The FontMetrics of the current font, used to (quickly) measure text. Shared between all buttons using the same font.
+        """
+        return self._get_metrics(self.font)
+
 
     @property
     def font_name(self):
@@ -393,12 +549,15 @@ class ButtonBase():
         """
         Re-builds a font object based on self.font_name and self.font_size, as well as the current self.scale.
         """
-        self.__font = self.__get_font(self.font_name, round(self.scale * self.font_size))
+        self.__font = self._get_font(self.font_name, round(self.scale * self.font_size))
         return
 
     @staticmethod
-    @weak_cache
-    def __get_font(name, size):
+    @weak_cache(maxsize = 64)
+    def _get_font(name, size):
+        """
+        Returns the pygame.font.Font for the given font name and (scaled) size. Fonts are cached, see help(weak_cache) for the available cache functions.
+        """
         #pygame.font.Font is used in favor of pygame.font.SysFont, as SysFont's font sizes are inconsistent with the value given for the font.
         try:
             return pygame.font.Font(name, size)
@@ -408,6 +567,11 @@ class ButtonBase():
                 raise FileNotFoundError(f"No such font: '{name}'")
             return pygame.font.Font(font, size)
 
+    @staticmethod
+    @weak_cache(maxsize = 64)
+    def _get_metrics(font):
+        return FontMetrics(font)
+
     def _Call(self, action):
         """
         Calls a function, if it exists, for the action specified
@@ -507,7 +671,9 @@ class ButtonBase():
         """
         The middle of the button, pre-scaled.
         """
-        return tuple(round(i / 2) for i in self.true_size)
+        if self.__scaled_rect is None:
+            self.__update_geometry()
+        return self.__middle
 
 
     #Setter for all main positions of the button, much like a pygame.rect
@@ -553,68 +719,102 @@ class ButtonBase():
         self.width, self.height = value
     @bottom.setter
     def bottom(self, value):
-        if not isinstance(value, (int, float)):
+        if Buttons.validate and not isinstance(value, (int, float)):
             raise TypeError(f"'bottom' must by type 'int' or 'float', not type '{type(value).__name__}'")
         self.top = value - self.height
     @top.setter
     def top(self, value):
-        if not isinstance(value, (int, float)):
+        if Buttons.validate and not isinstance(value, (int, float)):
             raise TypeError(f"'top' must by type 'int' or 'float', not type '{type(value).__name__}'")
         try:
             for child in self.children:
                 child._move((0, value - self.top)) #Move children along with the main Button
-        except AttributeError: pass #Catch error raised when .top is first set in __init__
+            true_size = self.true_size
+        except AttributeError: #Catch error raised when .top is first set in __init__
+            true_size = None
         self.__top = value
-        self.updated = True #Update button since moving might cause true_size to change
+        self.__scaled_rect = None
+        #Moving the button only requires its surface to be re-built if its true_size changed (due to rounding).
+        #Otherwise, the same surface is simply drawn at the new position.
+        if true_size is None or self.true_size != true_size:
+            self.updated = True
+        self._reindex()
     @left.setter
     def left(self, value):
-        if not isinstance(value, (int, float)):
+        if Buttons.validate and not isinstance(value, (int, float)):
             raise TypeError(f"'left' must by type 'int' or 'float', not type '{type(value).__name__}'")
         try:
             for child in self.children:
                 child._move((value - self.left, 0)) #Move children along with the main Button
-        except AttributeError: pass #Catch error raised when .left is first set in __init__
+            true_size = self.true_size
+        except AttributeError: #Catch error raised when .left is first set in __init__
+            true_size = None
         self.__left = value
-        self.updated = True#Update button since moving might cause true_size to change
+        self.__scaled_rect = None
+        #Moving the button only requires its surface to be re-built if its true_size changed (due to rounding).
+        #Otherwise, the same surface is simply drawn at the new position.
+        if true_size is None or self.true_size != true_size:
+            self.updated = True
+        self._reindex()
     @right.setter
     def right(self, value):
-        if not isinstance(value, (int, float)):
+        if Buttons.validate and not isinstance(value, (int, float)):
             raise TypeError(f"'right' must by type 'int' or 'float', not type '{type(value).__name__}'")
         self.left = value - self.width
     @centerx.setter
     def centerx(self, value):
-        if not isinstance(value, (int, float)):
+        if Buttons.validate and not isinstance(value, (int, float)):
             raise TypeError(f"'centerx' must by type 'int' or 'float', not type '{type(value).__name__}'")
         self.left = value - self.width / 2
     @centery.setter
     def centery(self, value):
-        if not isinstance(value, (int, float)):
+        if Buttons.validate and not isinstance(value, (int, float)):
             raise TypeError(f"'centery' must by type 'int' or 'float', not type '{type(value).__name__}'")
         self.top = value - self.height / 2
     @width.setter
     def width(self, value):
-        if not isinstance(value, (int, float)):
+        if Buttons.validate and not isinstance(value, (int, float)):
             raise TypeError(f"'width' must by type 'int' or 'float', not type '{type(value).__name__}'")
         self.__width = value
+        self.__scaled_rect = None
         self.updated = True
+        self._reindex()
     @height.setter
     def height(self, value):
-        if not isinstance(value, (int, float)):
+        if Buttons.validate and not isinstance(value, (int, float)):
             raise TypeError(f"'height' must by type 'int' or 'float', not type '{type(value).__name__}'")
         self.__height = value
+        self.__scaled_rect = None
         self.updated = True
+        self._reindex()
 
     #"True" size properties are used to prevent artifacting issues during scaling.
     # Although often the same as self.scaled(self.size), sometimes these will differ by a pixel due to rounding.
     @property
     def true_width(self):
-        return self.scaled(self.right) - self.scaled(self.left)
+        return self.true_size[0]
     @property
     def true_height(self):
-        return self.scaled(self.bottom) - self.scaled(self.top)
+        return self.true_size[1]
     @property
     def true_size(self):
-        return (self.true_width, self.true_height)
+        if self.__scaled_rect is None:
+            self.__update_geometry()
+        return self.__true_size
+
+    def __update_geometry(self):
+        """
+        Calculates the scaled rect of the button, and everything derived from it. These are cached until the position, size or scale of the button changes.
+        Returns the scaled (left, top, right, bottom).
+        """
+        scale = self.scale
+        left, top = self.left, self.top
+        right, bottom = left + self.width, top + self.height
+        self.__scaled_rect = (round(left * scale), round(top * scale), round(right * scale), round(bottom * scale))
+        self.__true_size = (self.__scaled_rect[2] - self.__scaled_rect[0], self.__scaled_rect[3] - self.__scaled_rect[1])
+        self.__middle = (round(self.__true_size[0] / 2), round(self.__true_size[1] / 2))
+        self.__scaled_topleft = (left * scale, top * scale)
+        return self.__scaled_rect
 
 
     def get_rect(self):
@@ -627,7 +827,30 @@ class ButtonBase():
         """
         Returns a pygame.Rect object of the scaled button rectangle.
         """
-        return pygame.Rect(self.scaled(self.topleft), self.true_size)
+        left, top, right, bottom = self.__scaled_rect or self.__update_geometry()
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def get_visual_rect(self):
+        """
+        Returns a pygame.Rect object of the scaled area the button draws to.
+        This is the same as get_scaled_rect, unless the button draws outside of its own area (e.g. the dropdown of a DropdownBox).
+        """
+        return self.get_scaled_rect()
+
+
+    def _index_rect(self):
+        """
+        Returns the (left, top, right, bottom) scaled area in which this button can respond to pointer inputs while it is not active.
+        Used to place the button in the spatial index of Buttons.
+        """
+        return self.__scaled_rect or self.__update_geometry()
+
+    def _reindex(self):
+        """
+        Updates the position of this button in the spatial index. Called automatically when the button is moved or (re-)scaled.
+        """
+        if self in Buttons._index:
+            Buttons._index.insert(self, self._index_rect())
 
 
 
@@ -646,4 +869,7 @@ class ButtonBase():
             raise TypeError(f"Cannot scale type '{type(value).__name__}'.")
 
     def relative(self, pos):
-        return self.offset(pos, self.scaled(self.topleft, False), (-1, -1))
+        if self.__scaled_rect is None:
+            self.__update_geometry()
+        left, top = self.__scaled_topleft
+        return (pos[0] - left, pos[1] - top)
@@ -47,6 +47,7 @@ class Button(ButtonBase):
     *.clicked: bool - Whether the Button has been set to a new state since the last time this variable was checked. Automatically resets once it is querried.
     *.moved: bool - Whether the Button has been dragged to a different location since the last time this variable was checked. Automatically resets once it is querried.
     """
+    __slots__ = ("__clicked", "__moved", "__text", "__text_align", "__value", "accent_bg", "bg", "border", "drag_pos", "dragable", "limits", "mode", "orientation", "snap", "text_offset")
     actions = ["LMB_down", "LMB_up", "Set_cursor_pos", "Mouse_motion"]
     def __init__(self, pos, size,
                  text = "",
@@ -112,7 +113,7 @@ class Button(ButtonBase):
         self.snap = self.Verify_iterable(snap, 3)
         self.moved = False
         self.clicked = False
-        self.Draw(pygame.Surface((1, 1))) #Makes sure all attributes are prepared and set-up correctly
+        self.Render() #Makes sure all attributes are prepared and set-up correctly
 
 
     def LMB_down(self, pos):
@@ -202,43 +203,36 @@ class Button(ButtonBase):
         self.Release_lock()
 
 
-    def Draw(self, screen, pos = None):
+    def Render(self):
         """
-        Draw the button to the screen.
+        Re-builds the surface of the button, if required.
         """
         if self.updated:
-            #Build the correct background for the surface
-            if not self.value:
-                self.surface = self.Make_background_surface(self.bg)
-            else:
-                self.surface = self.Make_background_surface(self.accent_bg)
-            #Draw a border, if it is enabled
-            if self.border:
-                self.Draw_border(self.surface, *self.border)
+            #Build the correct background for the surface, including the border (if it is enabled)
+            self.surface = self.Make_background(self.accent_bg if self.value else self.bg, self.border)
             #Draw the text onto the surface
             if self.text:
-                #Make a surface that fits within the border
+                #Find the area within the border in which the text is placed
                 text_offset = self.scaled(self.text_offset)
-                text_limiter = pygame.Surface(self.Clamp(self.offset(self.true_size, text_offset, (-2, -2)), 0, math.inf), pygame.SRCALPHA)
-                limiter_rect = text_limiter.get_rect()
-                text_surface = self.font.render(self.text, True, self.text_colour)
+                limiter_rect = pygame.Rect((0, 0), self.Clamp(self.offset(self.true_size, text_offset, (-2, -2)), 0, math.inf))
+                limiter_rect.center = self.middle
+                text_surface = self.Make_text_surface(self.text, self.text_colour, -90 * self.orientation)
 
-                if self.orientation:
-                    text_surface = pygame.transform.rotate(text_surface, -90 * self.orientation)
                 text_rect = text_surface.get_rect()
                 if not "bottom" in self.text_align:
                     text_rect.height = self.font.get_height()
                 #Align the text properly
                 align(text_rect, limiter_rect, self.text_align)
-                #Blit the text to the limiter surface, and then onto the screen
-                text_limiter.blit(text_surface, text_rect)
-                limiter_rect.center = self.middle
-                self.surface.blit(text_limiter, limiter_rect)
+                #Blit the text onto the surface, cutting it off at the edges of the limiter area
+                self.surface.set_clip(limiter_rect)
+                self.surface.blit(text_surface, text_rect)
+                self.surface.set_clip(None)
 
             #Clear self.updated again, as the surface has been remade.
             self.updated = False
-        screen.blit(self.surface, pos or self.scaled(self.topleft))
-        return
+
+    def get_blits(self, pos = None):
+        return [(self.surface, pos or self.scaled(self.topleft))]
 
     def _move(self, value):
         self.left += value[0]
@@ -4,6 +4,9 @@ import pygame
 
 import math
 import sys
+import weakref
+
+from .utils import SpatialGrid
 
 pygame.font.init() #Required to set a font
 
@@ -19,10 +22,13 @@ class Buttons():
 
     Available Actions - for more detailed information, see help(Buttons.*function_name*):
     Buttons.Event(pygame.Event, group) - Allows for a pygame.event to be processed completely autonomously, and be diverted to the correct buttons. No further intervention is required if this function is used.
-    Buttons.Draw(screen, group) - Draw all Buttons in the given group(s) to the given screen / pygame.Surface
+    Buttons.Events(events, group) - Processes all events of a frame at once (combining consecutive MOUSEMOTION events), and returns the events that were not used by any Button.
+    Buttons.Draw(screen, group) - Draw all Buttons in the given group(s) to the given screen / pygame.Surface. Can also return the areas of the screen that changed (dirty_rects = True), or draw through cached layers (layered = True).
     Buttons.Scale(scale, group) - Scales all Buttons in the given group to / by the given factor.
     Buttons.Move(offset, group) - Moves all Buttons in the given group by the given offset.
     Buttons.Clear(group) - Clears all user inputs from Buttons. Note: Does NOT remove the text from Text objects.
+    Buttons.Load_fonts(font_name, font_size, scales) - Loads the fonts required for the given scales in advance, to prevent loading them while scaling.
+    Buttons.Convert_surfaces(enabled) - Converts all surfaces to the pixel format of the display, which makes drawing faster. Enable after the display mode has been set.
 
     Buttons.Callbacks(enabled [bool]) - Enables or disables function callbacks. Can be used in conjunction with "with" statements.
     Buttons.Update_flags(enabled [bool]) - Enables or disables the update flags for buttons. Can be used in conjuction with "with" statements.
@@ -40,58 +46,152 @@ class Buttons():
     Class attributes:
     Buttons.input_claim - Contains whether or not the last input / event was fully claimed by a Button. E.G. If a DropdownBox was extended by clicking on the Arrow button.
     Buttons.input_processed - Contains whether or not the last input was used by a Button, even if they did not fully claim it. E.G. when exiting a TextBox by clicking outside of the TextBox area.
+    Buttons.validate - Whether arguments are checked for the correct types and values (default True). Can be set to False (or disabled using the environment variable PYGBUTTONS_VALIDATE=0) to skip these checks for speed.
     """
     #A base class for all buttons
     _input_lock = None #Either None, or the currently selected button. Used to give the currently selected button input priority.
     input_claim = False #Set to True if a button has claimed the input, to prevent an input from affecting multiple buttons.
     input_processed = False
 
-    list_all = [] #A list containing all buttons, except those marked as independent. Can be used for debugging, or just to keep a nice list of all buttons.
+    #Note: list_all and all groups are dicts used as (insertion ordered) sets, with all values being None. This keeps adding / removing buttons O(1).
+    list_all = {} #Contains all buttons, except those marked as independent. Can be used for debugging, or just to keep a nice list of all buttons.
     groups = {} #Groups to be used for getting certain buttons.
     scroll_factor = 1 #A factor to multiply scrolling with. Should be set based on the target DPI / resolution of the program
     #A framerate variable to help with timing animations
     framerate = 30
     min_scale = 0.05
     max_scale = 5
+    #If False, the type and value checks on arguments (e.g. in the position setters, Verify_iterable and Verify_colour) are skipped, which makes them a lot faster.
+    #Enabled by default. Can be disabled by setting Buttons.validate = False, or by setting the environment variable PYGBUTTONS_VALIDATE=0 before importing.
+    validate = os.environ.get("PYGBUTTONS_VALIDATE", "1").lower() not in ("0", "false", "no", "off")
+
+    #Pointer events are only passed to the buttons underneath the cursor, and to those which are currently active (selected).
+    _index = SpatialGrid(weak = True) #A spatial index containing the (scaled) rect of every button. Only keeps weak references, so buttons that are no longer used elsewhere (e.g. removed options) can be garbage collected.
+    #Maps every action onto all buttons that can perform it (as dicts used as sets of weak references, so unused buttons can be garbage collected). Filled based on the class' 'actions' when a button is created (see _Register).
+    _handlers = {action: {} for action in ("LMB_down", "LMB_up", "RMB_down", "RMB_up", "MMB_down", "MMB_up", "Scroll", "Key_down", "Key_up", "Mouse_motion", "Set_cursor_pos")}
+    _active = set() #All buttons that have requested the input lock, and might thus respond to inputs outside of their own rect.
+    _version = 0 #Incremented whenever the contents of list_all or any of the groups change. Invalidates the _group_cache.
+    _group_cache = {} #Maps (group, reverse) onto [list of buttons, dict of their positions (or None if not requested yet)].
+    _cache_version = 0 #The value of _version for which the _group_cache is valid.
+    #For every screen, maps the group drawn to it onto what each button blitted during the last Draw call. Used for Draw(dirty_rects = True).
+    _drawn = weakref.WeakKeyDictionary()
+    _layers = weakref.WeakKeyDictionary() #For every screen, maps the group drawn to it onto the Layers used for Draw(layered = True).
+    _draw_types = weakref.WeakKeyDictionary() #Caches for every button class whether its buttons draw themselves (see _draws_itself).
 
 
     @classmethod
     def get_group(cls, group, reverse = False):
         """
         Returns all buttons inside the given group / groups.
+        The result is cached until the contents of any group change, so the returned list should not be modified.
+        """
+        if isinstance(group, ButtonBase):
+            return [group]
+        return cls._cached_group(group, reverse)[0]
+
+    @classmethod
+    def _cached_group(cls, group, reverse):
+        """
+        Returns the cache entry for the given group and direction, (re-)building it if required.
+        """
+        if cls._cache_version != cls._version:
+            cls._group_cache.clear()
+            cls._cache_version = cls._version
+        key = (tuple(group) if isinstance(group, list) else group, reverse)
+        entry = cls._group_cache.get(key)
+        if entry is None:
+            entry = cls._group_cache[key] = [cls._build_group(group, reverse), None]
+        return entry
+
+    @classmethod
+    def _build_group(cls, group, reverse):
+        """
+        Builds a new list of all buttons inside the given group / groups. Used by get_group.
         """
         #If a list of groups is given, return the buttons in all the groups combined.
         if isinstance(group, (tuple, list)):
-            lst = []
+            #A dict is used as an ordered set to remove any duplicates
+            buttons = {}
             for grp in group:
                 if grp in cls.groups:
-                    for button in cls.groups[grp]:
-                        #Append all buttons in the group to the original group, if it is not a duplicate
-                        if button not in lst:
-                            lst.append(button)
-                #Else, if the group is already a Button, append that Button to the list instead
+                    #Add all buttons in the group. Duplicates keep the position at which they first occured.
+                    buttons.update(cls.groups[grp])
+                #Else, if the group is already a Button, add that Button instead
                 elif isinstance(grp, ButtonBase):
-                    lst.append(grp)
+                    buttons[grp] = None
             if reverse:
-                return list(reversed(lst))
+                return list(reversed(buttons))
             else:
-                return lst
+                return list(buttons)
         #Select the correct button group
         elif group is all: #If the group is the default 'all', return all buttons
             if reverse:
                 return list(reversed(cls.list_all))
             else:
-                return cls.list_all
+                return list(cls.list_all)
         elif group in cls.groups:
             if reverse:
                 return list(reversed(cls.groups[group]))
             else:
-                return cls.groups[group] #Return all buttons in the group.
+                return list(cls.groups[group]) #Return all buttons in the group.
         elif isinstance(group, ButtonBase):
             return [group]
         else: #If the group doesn't exist, return an empty list
             return []
 
+    @classmethod
+    def _get_rank(cls, group, reverse = False):
+        """
+        Returns a dict mapping all buttons inside the given group / groups onto their position in get_group(group, reverse).
+        The result is cached until any group membership changes.
+        """
+        if isinstance(group, ButtonBase):
+            return {group: 0}
+        entry = cls._cached_group(group, reverse)
+        if entry[1] is None:
+            entry[1] = {button: nr for nr, button in enumerate(entry[0])}
+        return entry[1]
+
+    @classmethod
+    def _pointer_targets(cls, pos, rank, action):
+        """
+        Returns all buttons in the given rank that could respond to a pointer event (action) at pos, in the same order as they are in their group.
+        These are the buttons whose rect contains pos, plus any currently active buttons (e.g. a selected TextBox, which deselects when clicking outside of it).
+        """
+        candidates = set(cls._index.query(pos))
+        candidates.update(cls._active)
+        return sorted((button for button in candidates if button in rank and action in button.actions), key = rank.__getitem__)
+
+    @classmethod
+    def _action_targets(cls, rank, action):
+        """
+        Returns all buttons in the given rank that can perform the given action, in the same order as they are in their group.
+        """
+        handlers = cls._handlers[action]
+        #Iterate over whichever of the two is smaller
+        if len(handlers) < len(rank):
+            return sorted((button for button in (ref() for ref in handlers) if button in rank), key = rank.__getitem__)
+        else:
+            return [button for button in rank if action in button.actions]
+
+    @classmethod
+    def _Register(cls, button):
+        """
+        Registers the button for all actions it can perform, such that events are only passed to buttons that can handle them.
+        A single weak reference to the button is shared between all actions, which removes the button from all of them once it is garbage collected.
+        """
+        ref = weakref.ref(button, cls._Unregister)
+        for action in button.actions:
+            cls._handlers.setdefault(action, {})[ref] = None
+
+    @staticmethod
+    def _Unregister(ref):
+        """
+        Removes a (weak reference to a) button from all actions. Called when the button is deleted or garbage collected.
+        """
+        for handlers in Buttons._handlers.values():
+            handlers.pop(ref, None)
+
     @classmethod
     def Add_to_group(cls, buttons, groups):
         """
@@ -139,6 +239,51 @@ class Buttons():
             cls.Mouse_motion(event, group, reverse)
 
 
+    @classmethod
+    def Events(cls, events, group = all, reverse = False):
+        """
+        Processes all events of a frame (e.g. pygame.event.get()) at once, and returns a list of all events that were not used by any Button.
+
+        Consecutive MOUSEMOTION events are combined into a single event at the last position (with the 'rel' movement of all of them combined), since Buttons only respond to the latest cursor position.
+        If this combined event is not used, the original (separate) events are returned, unmodified.
+        """
+        unused = []
+        motions = [] #All consecutive MOUSEMOTION events that have not been processed yet.
+        motion = None #The combination of all events in motions.
+        for event in events:
+            if not isinstance(event, pygame.event.EventType):
+                raise TypeError(f"Event should be type 'Event', not type {type(event).__name__}")
+            if event.type == pygame.MOUSEMOTION:
+                motion = event if motion is None else cls.merge_motion(motion, event)
+                motions.append(event)
+                continue
+            #Process any pending motion before the next event, as the next event might depend on the cursor position.
+            if motion is not None:
+                cls.Event(motion, group, reverse)
+                if not cls.input_processed:
+                    unused.extend(motions)
+                motions = []
+                motion = None
+            cls.Event(event, group, reverse)
+            if not cls.input_processed:
+                unused.append(event)
+        if motion is not None:
+            cls.Event(motion, group, reverse)
+            if not cls.input_processed:
+                unused.extend(motions)
+        return unused
+
+    @staticmethod
+    def merge_motion(first, second):
+        """
+        Combines two MOUSEMOTION events into one event at the position of the second event, with the 'rel' movement of both events combined.
+        """
+        attributes = dict(second.dict)
+        if "rel" in first.dict and "rel" in attributes:
+            attributes["rel"] = (first.rel[0] + second.rel[0], first.rel[1] + second.rel[1])
+        return pygame.event.Event(pygame.MOUSEMOTION, attributes)
+
+
     @classmethod
     def Update(cls, group = all):
         """
@@ -159,17 +304,17 @@ class Buttons():
         """
         cls.input_claim = False
         cls.input_processed = False
-        group_list = cls.get_group(group, reverse)
+        rank = cls._get_rank(group, reverse)
 
         #If a button has claimed an input lock
-        if cls._input_lock in group_list:
+        if cls._input_lock in rank:
             if "LMB_down" in cls._input_lock.actions:
                 cls._input_lock.LMB_down(pos)
                 if cls.input_claim:
                     return
 
-        for button in group_list:
-            if "LMB_down" in button.actions and button is not cls._input_lock:
+        for button in cls._pointer_targets(pos, rank, "LMB_down"):
+            if button is not cls._input_lock:
                 button.LMB_down(pos)
                 if cls.input_claim:
                     return
@@ -182,17 +327,17 @@ class Buttons():
         """
         cls.input_claim = False
         cls.input_processed = False
-        group_list = cls.get_group(group, reverse)
+        rank = cls._get_rank(group, reverse)
 
         #If a button has claimed an input lock
-        if cls._input_lock in group_list:
+        if cls._input_lock in rank:
             if "LMB_up" in cls._input_lock.actions:
                 cls._input_lock.LMB_up(pos)
                 if cls.input_claim:
                     return
 
-        for button in group_list:
-            if "LMB_up" in button.actions and button is not cls._input_lock:
+        for button in cls._pointer_targets(pos, rank, "LMB_up"):
+            if button is not cls._input_lock:
                 button.LMB_up(pos)
                 if cls.input_claim:
                     return
@@ -205,17 +350,17 @@ class Buttons():
         """
         cls.input_claim = False
         cls.input_processed = False
-        group_list = cls.get_group(group, reverse)
+        rank = cls._get_rank(group, reverse)
 
         #If a button has claimed an input lock
-        if cls._input_lock in group_list:
+        if cls._input_lock in rank:
             if "RMB_down" in cls._input_lock.actions:
                 cls._input_lock.RMB_down(pos)
                 if cls.input_claim:
                     return
 
-        for button in group_list:
-            if "RMB_down" in button.actions and button is not cls._input_lock:
+        for button in cls._pointer_targets(pos, rank, "RMB_down"):
+            if button is not cls._input_lock:
                 button.RMB_down(pos)
                 if cls.input_claim:
                     return
@@ -228,17 +373,17 @@ class Buttons():
         """
         cls.input_claim = False
         cls.input_processed = False
-        group_list = cls.get_group(group, reverse)
+        rank = cls._get_rank(group, reverse)
 
         #If a button has claimed an input lock
-        if cls._input_lock in group_list:
+        if cls._input_lock in rank:
             if "RMB_up" in cls._input_lock.actions:
                 cls._input_lock.RMB_up(pos)
                 if cls.input_claim:
                     return
 
-        for button in group_list:
-            if "RMB_up" in button.actions and button is not cls._input_lock:
+        for button in cls._pointer_targets(pos, rank, "RMB_up"):
+            if button is not cls._input_lock:
                 button.RMB_up(pos)
                 if cls.input_claim:
                     return
@@ -251,17 +396,17 @@ class Buttons():
         """
         cls.input_claim = False
         cls.input_processed = False
-        group_list = cls.get_group(group, reverse)
+        rank = cls._get_rank(group, reverse)
 
         #If a button has claimed an input lock
-        if cls._input_lock in group_list:
+        if cls._input_lock in rank:
             if "MMB_down" in cls._input_lock.actions:
                 cls._input_lock.MMB_down(pos)
                 if cls.input_claim:
                     return
 
-        for button in group_list:
-            if "MMB_down" in button.actions and button is not cls._input_lock:
+        for button in cls._pointer_targets(pos, rank, "MMB_down"):
+            if button is not cls._input_lock:
                 button.MMB_down(pos)
                 if cls.input_claim:
                     return
@@ -274,17 +419,17 @@ class Buttons():
         """
         cls.input_claim = False
         cls.input_processed = False
-        group_list = cls.get_group(group, reverse)
+        rank = cls._get_rank(group, reverse)
 
         #If a button has claimed an input lock
-        if cls._input_lock in group_list:
+        if cls._input_lock in rank:
             if "MMB_up" in cls._input_lock.actions:
                 cls._input_lock.MMB_up(pos)
                 if cls.input_claim:
                     return
 
-        for button in group_list:
-            if "MMB_up" in button.actions and button is not cls._input_lock:
+        for button in cls._pointer_targets(pos, rank, "MMB_up"):
+            if button is not cls._input_lock:
                 button.MMB_up(pos)
                 if cls.input_claim:
                     return
@@ -297,17 +442,17 @@ class Buttons():
         """
         cls.input_claim = False
         cls.input_processed = False
-        group_list = cls.get_group(group, reverse)
+        rank = cls._get_rank(group, reverse)
 
-        if cls._input_lock in group_list:
+        if cls._input_lock in rank:
             if "Scroll" in cls._input_lock.actions:
                 cls._input_lock.Scroll(value, pos)
                 if cls.input_claim:
                     return
 
-        for button in group_list:
-            #If the button hasn't been processed yet in the input_lock section, and has the "Scroll" attribute:
-            if "Scroll" in button.actions and button is not cls._input_lock:
+        for button in cls._pointer_targets(pos, rank, "Scroll"):
+            #If the button hasn't been processed yet in the input_lock section:
+            if button is not cls._input_lock:
                 button.Scroll(value, pos)
                 if cls.input_claim:
                     return
@@ -320,17 +465,17 @@ class Buttons():
         """
         cls.input_claim = False
         cls.input_processed = False
-        group_list = cls.get_group(group, reverse)
+        rank = cls._get_rank(group, reverse)
         #If any button in the current scope requires keyboard inputs / has focus:
-        if cls._input_lock in group_list:
+        if cls._input_lock in rank:
             if "Key_down" in cls._input_lock.actions:
                 cls._input_lock.Key_down(event)
                 if cls.input_claim:
                     return
 
-        for button in group_list:
-            #If the button hasn't been processed yet in the input_lock section, and has the "Key_down" attribute:
-            if "Key_down" in button.actions and button is not cls._input_lock:
+        for button in cls._action_targets(rank, "Key_down"):
+            #If the button hasn't been processed yet in the input_lock section:
+            if button is not cls._input_lock:
                 button.Key_down(event)
                 if cls.input_claim:
                     return
@@ -342,17 +487,17 @@ class Buttons():
         """
         cls.input_claim = False
         cls.input_processed = False
-        group_list = cls.get_group(group, reverse)
+        rank = cls._get_rank(group, reverse)
         #If any button in the current scope requires keyboard inputs / has focus:
-        if cls._input_lock in group_list:
+        if cls._input_lock in rank:
             if "Key_up" in cls._input_lock.actions:
                 cls._input_lock.Key_up(event)
                 if cls.input_claim:
                     return
 
-        for button in group_list:
-            #If the button hasn't been processed yet in the input_lock section, and has the "Key_up" attribute:
-            if "Key_up" in button.actions and button is not cls._input_lock:
+        for button in cls._action_targets(rank, "Key_up"):
+            #If the button hasn't been processed yet in the input_lock section:
+            if button is not cls._input_lock:
                 button.Key_up(event)
                 if cls.input_claim:
                     return
@@ -363,10 +508,10 @@ class Buttons():
         Updates the cursor position. Required for e.g. sliders.
         Only active for the button which currently holds the _input_lock to prevent excessive function call overhead.
         """
-        group_list = cls.get_group(group, reverse)
-        if cls._input_lock in group_list:
+        if cls._input_lock in cls._get_rank(group, reverse):
             if "Mouse_motion" in cls._input_lock.actions:
                 cls._input_lock.Mouse_motion(event)
+                cls.input_processed = True
 
 
     @classmethod
@@ -377,12 +522,11 @@ class Buttons():
         if not hasattr(cls, "depr_update"):
             cls.depr_update = True
             print(f"Set_cursor_pos will be deprecated in the next version. All functionality has been taken over by the MOUSEMOTION event. Please replace all direct calls to Buttons.Set_cursor_pos with Buttons.Mouse_motion.", file = sys.stderr)
-        group_list = cls.get_group(group)
+        rank = cls._get_rank(group)
         if not cls._input_lock:
-            for button in group_list:
-                if "Set_cursor_pos" in button.actions:
-                    button.Set_cursor_pos(pos)
-        elif cls._input_lock in group_list:
+            for button in cls._action_targets(rank, "Set_cursor_pos"):
+                button.Set_cursor_pos(pos)
+        elif cls._input_lock in rank:
             if "Set_cursor_pos" in cls._input_lock.actions:
                 cls._input_lock.Set_cursor_pos(pos)
 
@@ -466,6 +610,37 @@ class Buttons():
         for button in cls.get_group(group):
             button.Clear()
 
+    @staticmethod
+    def Load_fonts(font_name = pygame.font.get_default_font(), font_size = 22, scales = (1,)):
+        """
+        Loads the fonts with the given name and size at all given scales in advance, so scaling buttons to those scales does not require any fonts to be loaded from disk.
+        Only the 64 most recently used fonts (not counting fonts still used by a button) are kept loaded.
+
+        font_name: str - The name of the font, as given to the buttons.
+        font_size: int - The (unscaled) size of the font, as given to the buttons.
+        scales: iterable - All scales for which the font should be loaded.
+        """
+        ButtonBase._get_font.prewarm((font_name, round(scale * font_size)) for scale in scales)
+
+    @classmethod
+    def Convert_surfaces(cls, enabled = True):
+        """
+        Sets whether the surfaces of all buttons are converted to the pixel format of the display (using pygame.Surface.convert_alpha).
+        Blitting surfaces that already have the pixel format of the display is faster, which speeds up Buttons.Draw.
+        Can only be enabled once the display exists (see pygame.display.set_mode). Should be called again if the display mode changes.
+        All cached surfaces are cleared, and all buttons are re-rendered the next time they are drawn.
+
+        enabled: bool - Whether surfaces should be converted.
+        """
+        if enabled and pygame.display.get_surface() is None:
+            raise pygame.error("Surfaces can only be converted once the display mode has been set")
+        ButtonBase.convert_surfaces = bool(enabled)
+        for cache in (ButtonBase._surface_cache, ButtonBase._scaled_cache, ButtonBase._text_cache):
+            cache.clear()
+        #The spatial index contains every existing button, including independent buttons and children which are not part of list_all.
+        for button in cls._index:
+            button.updated = True
+
     @classmethod
     def Deselect(cls, group = all):
         """
@@ -478,32 +653,201 @@ class Buttons():
 
 
     @classmethod
-    def Draw(cls, screen, group = all, reverse = True):
+    def Draw(cls, screen, group = all, reverse = True, *, dirty_rects = False, layered = False, clip_rect = None):
         """
         Draw all buttons in the specified group to the screen / Surface provided.
+
+        dirty_rects: bool - If True, returns a list of pygame.Rects containing all areas of the screen that changed since the previous Draw call (with dirty_rects = True) of the same group to the same screen.
+                            These are the areas of all buttons that were re-drawn or moved, as well as any areas they no longer cover (e.g. after a DropdownBox collapsed, or a button was deleted).
+                            The list can be passed to pygame.display.update() instead of using pygame.display.flip(). Note: Any changes to the screen which are not made by the Buttons have to be added separately.
+        layered: bool - If True, the buttons are first drawn onto cached layer surfaces, which are then drawn to the screen. Every group in the given tuple / list of groups gets its own layer (a single group gets a single layer).
+                        Only the areas of a layer in which a button changed are re-drawn, so each frame only costs one blit per layer for mostly static UIs.
+                        The button with the input lock is drawn on top of all layers directly, as it would be otherwise.
+        clip_rect: pygame.Rect, None - If given, only the part of the screen within this rect is drawn to.
+        Note: Buttons that lie completely outside of the screen (or clip_rect) are skipped entirely. Any changes to them are only rendered once they become visible again.
+        Note: Buttons of classes which override Draw more recently than get_blits (e.g. a subclass of Button which only overrides Draw) are drawn using button.Draw(screen), in the same order. Their whole area counts as changed on every call.
         """
+        group_key = tuple(group) if isinstance(group, list) else group
+        viewport = screen.get_clip()
+        if clip_rect is not None:
+            viewport = viewport.clip(clip_rect)
+        if layered:
+            return cls._Draw_layers(screen, group, group_key, reverse, dirty_rects, viewport)
         #Select the correct button group
         group_list = cls.get_group(group, reverse)
+        #All buttons are rendered first, after which all their surfaces are blitted to the screen at once.
+        sequence = []
+        drawn = {}
+        redrawn = []
+        clip = screen.get_clip()
+        screen.set_clip(viewport)
         #Click all buttons without the "Cursor Lock".
         for button in group_list:
-            if button is not cls._input_lock:
-                button.Draw(screen)
+            if button is not cls._input_lock and viewport.colliderect(button.get_visual_rect()):
+                blits = cls._Collect_blits(screen, button, sequence, redrawn)
+                if dirty_rects:
+                    drawn[button] = (False, tuple(blits))
         #Draw the button with the "Input Lock" last, to make it always appear on top.
-        if cls._input_lock:
-            if cls._input_lock in group_list:
-                cls._input_lock.Draw(screen)
+        if cls._input_lock and viewport.colliderect(cls._input_lock.get_visual_rect()):
+            if cls._input_lock in cls._get_rank(group, reverse):
+                blits = cls._Collect_blits(screen, cls._input_lock, sequence, redrawn)
+                if dirty_rects:
+                    drawn[cls._input_lock] = (True, tuple(blits))
+        screen.blits(sequence, doreturn = False)
+        screen.set_clip(clip)
+
+        if dirty_rects:
+            screen_drawn = cls._drawn.setdefault(screen, {})
+            previous = screen_drawn.get(group_key, {})
+            screen_drawn[group_key] = drawn
+            return cls._visible_rects(cls._changed_rects(previous, drawn) + redrawn, viewport)
+
+    @classmethod
+    def _draws_itself(cls, button):
+        """
+        Returns whether the Draw method of the button is defined in a more derived class than its get_blits method (e.g. custom buttons written before get_blits existed, or a subclass of Button which only overrides Draw).
+        Such buttons cannot be combined into a single blits call, and have to draw themselves using button.Draw(screen) instead.
+        """
+        button_type = type(button)
+        draws_itself = cls._draw_types.get(button_type)
+        if draws_itself is None:
+            draws_itself = False
+            #The first class in the MRO which defines either method decides which one takes precedence.
+            for base in button_type.__mro__:
+                if "get_blits" in vars(base):
+                    break
+                if "Draw" in vars(base):
+                    draws_itself = True
+                    break
+            cls._draw_types[button_type] = draws_itself
+        return draws_itself
+
+    @classmethod
+    def _Collect_blits(cls, screen, button, sequence, redrawn):
+        """
+        Renders the button and adds its blits to sequence, and returns them.
+        If the button draws itself (see _draws_itself), the sequence so far is drawn to the screen first (and emptied) to keep the drawing order, after which the button is drawn directly.
+        Its area is then added to redrawn (as it is re-drawn every time), and a (None, area) placeholder is returned instead of its blits.
+        """
+        if cls._draws_itself(button):
+            screen.blits(sequence, doreturn = False)
+            sequence.clear()
+            button.Draw(screen)
+            rect = button.get_visual_rect()
+            redrawn.append(rect)
+            return [(None, rect)]
+        button.Render()
+        blits = button.get_blits()
+        sequence.extend(blits)
+        return blits
+
+    @classmethod
+    def _Draw_layers(cls, screen, group, group_key, reverse, dirty_rects, viewport):
+        """
+        Draws the given group(s) using one cached Layer per group. See help(Buttons.Draw) for more information.
+        """
+        specs = list(group) if isinstance(group, (tuple, list)) else [group]
+        #Split the buttons over the layers, such that each button is only part of the first group it is in (like in get_group).
+        seen = {}
+        members = []
+        for spec in specs:
+            buttons = [button for button in cls.get_group(spec) if button not in seen and button is not cls._input_lock]
+            seen.update(dict.fromkeys(buttons))
+            members.append(buttons)
+        if reverse:
+            members = [list(reversed(buttons)) for buttons in reversed(members)]
+
+        screen_layers = cls._layers.setdefault(screen, {})
+        layers = screen_layers.get((group_key, reverse))
+        #(Re-)build the layers if they do not exist yet, or no longer fit the screen.
+        if layers is None or len(layers) != len(members) or (layers and layers[0].surface.get_size() != screen.get_size()):
+            layers = screen_layers[(group_key, reverse)] = [Layer(screen.get_size()) for _ in members]
+
+        rects = []
+        for layer, buttons in zip(layers, members):
+            rects.extend(layer.Update(buttons, viewport))
+        sequence = [(layer.surface, (0, 0)) for layer in layers]
+
+        #Draw the button with the input lock on top of all layers.
+        drawn = {}
+        redrawn = []
+        clip = screen.get_clip()
+        screen.set_clip(viewport)
+        if cls._input_lock and cls._input_lock in cls._get_rank(group, reverse) and viewport.colliderect(cls._input_lock.get_visual_rect()):
+            blits = cls._Collect_blits(screen, cls._input_lock, sequence, redrawn)
+            drawn[cls._input_lock] = (True, tuple(blits))
+        screen.blits(sequence, doreturn = False)
+        screen.set_clip(clip)
+        screen_drawn = cls._drawn.setdefault(screen, {})
+        previous = screen_drawn.get(("overlay", group_key), {})
+        screen_drawn[("overlay", group_key)] = drawn
+        rects.extend(cls._changed_rects(previous, drawn) + redrawn)
+
+        if dirty_rects:
+            return cls._visible_rects(rects, viewport)
+
+    @staticmethod
+    def _visible_rects(rects, viewport):
+        """
+        Returns the parts of the given rects that lie within the viewport, leaving out any rects that lie outside of it.
+        """
+        return [rect for rect in (rect.clip(viewport) for rect in rects) if rect.width and rect.height]
+
+    @staticmethod
+    def _changed_rects(previous, drawn):
+        """
+        Compares what every button drew with what it drew the previous time, and returns all areas that changed.
+        previous, drawn: dict - Maps every button onto a tuple of (whether it was drawn on top, tuple of all its blits (see ButtonBase.get_blits)).
+        Note: previous is emptied in the process.
+        """
+        changed = []
+        for button, (on_top, blits) in drawn.items():
+            old = previous.pop(button, None)
+            #Blitting a different surface (e.g. because the button was updated), a different area of it, at a different location, or in a different order changes the screen.
+            #Surfaces are compared by identity, as buttons always create new surfaces when they are updated.
+            if old is None or old[0] != on_top:
+                changed.extend(blits)
+                if old is not None:
+                    changed.extend(blit for blit in old[1] if blit not in blits)
+            elif old[1] != blits:
+                #Only the blits that changed have to be updated (e.g. only the slider of a Slider that is being dragged).
+                changed.extend(blit for blit in blits if blit not in old[1])
+                changed.extend(blit for blit in old[1] if blit not in blits)
+        #Any buttons that are no longer drawn have uncovered the area they used to cover.
+        for on_top, blits in previous.values():
+            changed.extend(blits)
+        rects = []
+        for blit in changed:
+            rect = Buttons._blit_rect(blit)
+            if rect.width and rect.height and rect not in rects:
+                rects.append(rect)
+        return rects
+
+    @staticmethod
+    def _blit_rect(blit):
+        """
+        Returns the area of the target surface covered by a (surface, position) or (surface, position, area) blit.
+        A (None, area) placeholder (see _Collect_blits) covers the given area.
+        """
+        if blit[0] is None:
+            return pygame.Rect(blit[1])
+        if len(blit) > 2 and blit[2] is not None:
+            return pygame.Rect(blit[1], pygame.Rect(blit[2]).clip(blit[0].get_rect()).size)
+        return pygame.Rect(blit[1], blit[0].get_size())
 
 
     @classmethod
     def Force_update(cls, group):
         """
         A function that forces a button to get updated. Can be used when an attribute is changed which does not directly cause it to update.
+        This includes changes made in-place to a surface used by the button (e.g. as its bg), as any cached scaled versions of its surfaces are dropped as well.
         """
         for button in cls.get_group(group):
+            button._Forget_scaled()
             # Querry the button for a re-draw
             button.updated = True
             # Finish the re-draw / update
-            button.Draw(pygame.Surface((1, 1)))
+            button.Render()
 
 
     @classmethod
@@ -522,7 +866,10 @@ class Buttons():
     def Verify_iterable(value, length = 2, data_types = None):
         """
         A function that verifies whether a given iterable has the required length, and whether all items in the iterable are of the correct types.
+        If Buttons.validate is False, the value is assumed to be correct, and is returned as a tuple straight away.
         """
+        if not Buttons.validate:
+            return value if type(value) is tuple else tuple(value)
         if not hasattr(value, "__iter__"):
             raise ValueError("Given value is not iterable")
         value_iterator = value.__iter__()
@@ -635,3 +982,66 @@ class Buttons():
     @min_scale.setter
     def max_scale(self, value):
         ButtonBase.max_scale = value
+    @property
+    def smoothscale(self):
+        return ButtonBase.smoothscale
+    @smoothscale.setter
+    def smoothscale(self, value):
+        ButtonBase.smoothscale = value
+
+
+class Layer():
+    """
+    A cached, transparent surface onto which a group of buttons is drawn, used by Buttons.Draw(layered = True).
+    Only the areas in which any of the buttons changed are cleared and re-drawn.
+    For internal use only. This class is therefore also not imported by __init__.py
+    """
+    merge_limit = 16 #If more areas than this changed, they are merged into one area to limit the amount of work.
+
+    def __init__(self, size):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.drawn = {}
+
+    def Update(self, buttons, viewport):
+        """
+        Update the layer to show the given buttons (drawn in order), and return the areas that changed.
+        Buttons outside of the viewport are left out of the layer, and are not rendered.
+        """
+        viewport = viewport.clip(self.surface.get_rect())
+        drawn = {}
+        redrawn = []
+        for button in buttons:
+            if not viewport.colliderect(button.get_visual_rect()):
+                continue
+            #Buttons which draw themselves are drawn onto the layer below, so their area is simply re-drawn every time.
+            if Buttons._draws_itself(button):
+                rect = button.get_visual_rect()
+                redrawn.append(rect)
+                drawn[button] = (False, ((None, rect),))
+                continue
+            button.Render()
+            drawn[button] = (False, tuple(button.get_blits()))
+        rects = Buttons._changed_rects(self.drawn, drawn) + redrawn
+        self.drawn = drawn
+        if not rects:
+            return rects
+
+        areas = rects if len(rects) <= self.merge_limit else [rects[0].unionall(rects[1:])]
+        blits = [(button, blit, Buttons._blit_rect(blit)) for button, (on_top, button_blits) in drawn.items() for blit in button_blits]
+        for area in areas:
+            #Clear the area, and re-draw everything that overlaps it
+            self.surface.fill((0, 0, 0, 0), area)
+            self.surface.set_clip(area)
+            sequence = []
+            for button, blit, rect in blits:
+                if not rect.colliderect(area):
+                    continue
+                if blit[0] is None:
+                    self.surface.blits(sequence, doreturn = False)
+                    sequence = []
+                    button.Draw(self.surface)
+                else:
+                    sequence.append(blit)
+            self.surface.blits(sequence, doreturn = False)
+            self.surface.set_clip(None)
+        return rects
@@ -54,6 +54,7 @@ class DropdownBox(ButtonBase):
     *.is_selected: bool - Whether this DropdownBox object is selected at this point in time. I.E. Whether DropdownBox is expanded.
     *.clicked: bool - Whether the DropdownBox has been clicked anywhere (except the scroll bar), thus changing from selected to deselected (or vice versa).
     """
+    __slots__ = ("__clicked", "__hint_align", "__new_state", "__option_align", "__scrolled", "__state", "__value_align", "_moved", "accent_bg", "arrow", "bg", "border", "button_list", "button_surface", "display_length", "dropdown_bg", "dropdown_surface", "hint", "hint_colour", "main_button", "options", "scroll_bar", "spacing")
     actions = ["LMB_down", "LMB_up", "Set_cursor_pos", "Scroll", "Mouse_motion"]
     def __init__(self, pos, size,
                  options = [],
@@ -131,7 +132,7 @@ class DropdownBox(ButtonBase):
         #Add in all the options
         for option in options:
             self.Add_option(option)
-        self.Draw(pygame.Surface((1, 1))) #Makes sure all attributes are set-up correctly
+        self.Render() #Makes sure all attributes are set-up correctly
 
 
     def LMB_down(self, pos):
@@ -216,16 +217,10 @@ class DropdownBox(ButtonBase):
             self.scroll_bar.Clear()
 
 
-    def Draw(self, screen, pos = None):
+    def Render(self):
         """
-        Draw the button to the screen.
+        Re-builds the surfaces of the DropdownBox, if required.
         """
-        #Set the correct position for the dropdown_surface
-        dropdown_pos = (self.scaled(self.left), self.scaled(self.bottom) + self.scaled(self.spacing[1]))
-        if pos is not None:
-            offset = self.offset(pos, self.scaled(self.topleft), (-1, -1))
-            dropdown_pos = self.offset(dropdown_pos, offset)
-
         self.scrolled
         #If the box has been updated, re-draw this stuff:
         if self.updated:
@@ -239,7 +234,7 @@ class DropdownBox(ButtonBase):
 
             #Re-build the button surface
             #Re-draw self.button_surface (the pre-rendered surface containing ALL buttons stacked underneath each other)
-            self.button_surface = pygame.Surface((self.true_width - (self.scroll_bar.true_width if self.scroll_bar else 0), self.scaled(self.button_list[-1].bottom) - self.scaled(self.button_list[0].top) if self.button_list else 0), pygame.SRCALPHA)
+            self.button_surface = self._display_format(pygame.Surface((self.true_width - (self.scroll_bar.true_width if self.scroll_bar else 0), self.scaled(self.button_list[-1].bottom) - self.scaled(self.button_list[0].top) if self.button_list else 0), pygame.SRCALPHA))
             for button in self.button_list:
                 button.Draw(self.button_surface, (0, button.scaled(button.top) - self.scaled(self.button_list[0].top)))
 
@@ -254,11 +249,25 @@ class DropdownBox(ButtonBase):
 
             self._moved = False
 
+    def get_blits(self, pos = None):
+        #Set the correct position for the dropdown_surface
+        dropdown_pos = (self.scaled(self.left), self.scaled(self.bottom) + self.scaled(self.spacing[1]))
+        if pos is not None:
+            offset = self.offset(pos, self.scaled(self.topleft), (-1, -1))
+            dropdown_pos = self.offset(dropdown_pos, offset)
+
+        blits = []
+        if self.is_selected:
+            blits.append((self.dropdown_surface, dropdown_pos))
+        blits.append((self.surface, pos or self.scaled(self.topleft)))
+        return blits
 
+    def get_visual_rect(self):
+        rect = self.get_scaled_rect()
         if self.is_selected:
-            screen.blit(self.dropdown_surface, dropdown_pos)
-        screen.blit(self.surface, pos or self.scaled(self.topleft))
-        return
+            #Include the area of the dropdown_surface
+            rect.union_ip(pygame.Rect((self.scaled(self.left), self.scaled(self.bottom) + self.scaled(self.spacing[1])), (self.true_width, self._true_pixel_length)))
+        return rect
 
 
     def Add_option(self, value, index = -1, set_to = False):
@@ -369,7 +378,7 @@ class DropdownBox(ButtonBase):
         #Remove all references to the button / option from this butttons' lists
         self.children.remove(self.button_list[index])
         self.options.pop(index)
-        self.button_list.pop(index)
+        self.button_list.pop(index).Delete()
 
         #Move the relevant buttons upwards again
         for button in self.button_list[index:]:
@@ -50,6 +50,7 @@ class Slider(ButtonBase):
 
     *.is_selected: bool - Whether this Slider object is selected at this point in time. I.E. Whether the user is currently moving the Slider.
     """
+    __slots__ = ("__clicked", "__is_selected", "__moved", "__value", "__value_range", "_moved", "bg", "border", "edge_markings", "marking_colour", "markings", "orientation", "slider", "start_value", "tmp_slider_size")
     actions = ["LMB_down", "LMB_up", "Set_cursor_pos", "Mouse_motion"]
     def __init__(self, pos, size,
                  value_range = (0, 1),
@@ -116,7 +117,8 @@ class Slider(ButtonBase):
         self.is_selected = False
         self.moved = False #Indicates whether there is a chance the slider has moved. If so, the user can take action (if necessary).
         self.clicked = False
-        self.Draw(pygame.Surface((1, 1))) #Makes sure all attributes are set-up correctly
+        self._reindex() #Include the slider in the indexed area, now that it exists
+        self.Render() #Makes sure all attributes are set-up correctly
 
 
     def LMB_down(self, pos):
@@ -188,23 +190,14 @@ class Slider(ButtonBase):
             self.slider.Deselect()
 
 
-    def Draw(self, screen, pos = None):
+    def Render(self):
         """
-        Draw the button to the screen.
+        Re-builds the surfaces of the Slider and the slider, if required.
         """
-        #Set draw positions for when a custom location is given
-        if pos is not None:
-            slider_pos = self.offset(self.slider.scaled(self.slider.topleft), self.offset(pos, self.scaled(self.topleft), (-1, -1)))
-        else:
-            pos = self.scaled(self.topleft)
-            slider_pos = None
-
         #Update the button surface (if necessary)
         if self.updated:
             #Now, let's actually construct the surface
-            self.surface = self.Make_background_surface(self.bg)
-            if self.border:
-                self.Draw_border(self.surface, *self.border)
+            self.surface = self.Make_background(self.bg, self.border)
 
             if self.markings:
                 #Set up the information of the marking itself
@@ -219,13 +212,35 @@ class Slider(ButtonBase):
                     pygame.draw.rect(self.surface, self.marking_colour, marking_rect)
 
             self.updated = False
+        self.slider.Render()
+
+    def get_blits(self, pos = None):
+        #Set draw positions for when a custom location is given
+        if pos is not None:
+            slider_pos = self.offset(self.slider.scaled(self.slider.topleft), self.offset(pos, self.scaled(self.topleft), (-1, -1)))
+        else:
+            pos = self.scaled(self.topleft)
+            slider_pos = None
+        return [(self.surface, pos)] + self.slider.get_blits(slider_pos)
+
+    def get_visual_rect(self):
+        return self.get_scaled_rect().union(self.slider.get_visual_rect())
 
-        screen.blit(self.surface, pos)
-        self.slider.Draw(screen, slider_pos)
-        return
 
 
 
+    def _index_rect(self):
+        """
+        The area of the Slider, extended to include the slider if it sticks out of the Slider bar.
+        As the slider only moves along the bar, this area does not change when the slider is moved.
+        """
+        left, top, right, bottom = super()._index_rect()
+        try:
+            s_left, s_top, s_right, s_bottom = self.slider._index_rect()
+        except AttributeError: #During setup, the slider does not exist yet
+            return (left, top, right, bottom)
+        return (min(left, s_left), min(top, s_top), max(right, s_right), max(bottom, s_bottom))
+
 
     def rotated(self, value, other = None):
         """
@@ -294,6 +309,7 @@ class Slider(ButtonBase):
         #Update the sliders' snap points
         self.slider.snap = self.rotated(tuple(self.rotated(self.topleft)[0] - value / 2 + coord for coord in self.Marking_coords()), ()) + (self.slider.snap[2],)
         self.updated = True
+        self._reindex()
 
 
     @property
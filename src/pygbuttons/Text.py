@@ -6,7 +6,8 @@ from .utils import alignX, alignY
 import os
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = ""
 import pygame
-import math
+from bisect import bisect_right
+from collections import deque
 
 
 class Text(ButtonBase):
@@ -23,6 +24,8 @@ class Text(ButtonBase):
     text_align: The alignment of the text on the Button surface.
     text_offset: "auto", int, (x, y) - The offset the text should have from the sides of the Text object. Prevents the text from overlapping with borders, and touching the edges.
     scroll_bar: None, int, Slider - The type of scrollbar to be included. Default styles 1 and 2 are available.
+    max_lines: None, int - The maximum amount of lines (after wrapping) that are kept. If there are more, the oldest lines of text are dropped. Useful for logs. See *.max_lines.
+    max_chars: None, int - The maximum amount of characters of text that are kept. If there are more, the oldest lines of text are dropped. See *.max_chars.
     background: pygame.Surface, (R, G, B), None, function - The background of the button.
     border: ((R, G, B), width, offset), None - The border that appears around the TextBox.
     functions: dict - Contains functions that should be called when a specific event occurs. The values should either be {"Click": func,} to call a function without arguments, or {"Click": (func, arg1, arg2, ...)} to call a function with arguments. If the Button itself is to be passed in as an argument, that argument can be passed in as '*self*'. This argument will automatically replaced when the function is actually called.
@@ -35,13 +38,16 @@ class Text(ButtonBase):
     *.value: str - Can be used synonymously with *.text.
     *.text: str - Allows the user to set a new value for the Text objects' displayed text.
     *.lines: tuple - Allows the user to set a new value for 'lines' (the text as it is split to fit properly accros the lines).
-    *.write(value) - Appends text to self.text. Allows this button to be used as an output for e.g. the print() function.
+    *.write(value) - Appends text to self.text. Allows this button to be used as an output for e.g. the print() function. Only the end of the text is wrapped again, so writing stays fast for long texts.
+    *.max_lines, *.max_chars: None, int - Limit the amount of lines / characters that are kept. Whole lines of text (up to a newline) are dropped from the start, oldest first, until both limits are met. The last line of text is never dropped.
 
     Outputs:
     *.value: str - Synonymous with *.text.
     *.text: str - The current text being rendered to the surface.
     *.lines: tuple - The current text being rendered to the surface, as it is split to prevent it from exceeding the Surface borders.
     """
+    __slots__ = ("__band", "__head", "__line_tops", "__lines", "__max_chars", "__max_lines", "__moved", "__paragraph_chars", "__paragraphs", "__scrolled", "__tail", "__tail_lines", "__text_align",
+                 "__vert_offset", "__wrapped", "_moved", "bg", "bg_surface", "border", "scroll_bar", "text_offset", "text_px_height", "text_surface")
     actions = ["Scroll", "LMB_down", "LMB_up", "Set_cursor_pos", "Mouse_motion"]
     def __init__(self, pos, size,
                  text = "",
@@ -52,6 +58,8 @@ class Text(ButtonBase):
                  text_align = "topleft",
                  text_offset = "auto",
                  scroll_bar = None,
+                 max_lines = None,
+                 max_chars = None,
                  background = None,
                  border = None,
                  functions = {},
@@ -89,9 +97,11 @@ class Text(ButtonBase):
             self.scroll_bar = None
         self.__scrolled = 0
         self.moved = False
+        self.max_lines = max_lines
+        self.max_chars = max_chars
         self.text = text
         self.Build_lines()
-        self.Draw(pygame.Surface((1, 1))) #Makes sure all attributes are set-up correctly
+        self.Render() #Makes sure all attributes are set-up correctly
 
 
     def LMB_down(self, pos):
@@ -152,66 +162,88 @@ class Text(ButtonBase):
             self.scroll_bar.Deselect()
 
 
-    def Draw(self, screen, pos = None):
+    def Render(self):
         """
-        Draw the button to the screen.
+        Re-builds the surfaces of the Text object, if required.
         """
         self._scrolled #Update the scrolled position quickly, so that any .moved = True are set
-        pos = pos or self.scaled(self.topleft)
 
         if self.updated:
             self.Build_lines()
             self._moved = True
 
             #Make the background surface
-            self.bg_surface = self.Make_background_surface(self.bg)
-            if self.border:
-                self.Draw_border(self.bg_surface, *self.border)
+            self.bg_surface = self.Make_background(self.bg, self.border)
 
-            font_height = self.font.get_height()
             if self.px_height >= self.text_px_height:
                 #If the text fully fits within the available space, calculate the vertical offset to get the right alignment
-                vert_offset = alignY(self.text_px_height, self.px_height, self.text_align).top
+                self.__vert_offset = alignY(self.text_px_height, self.px_height, self.text_align).top
             else:
                 #If the text requires scrolling, vertical alignment doesn't matter anymore (all vertical alignment is taken over by the scrolled value)
-                vert_offset = 0
-
-            #Build the surface containing ALL lines of text
-            self.text_surface =  pygame.Surface((self.px_width, self.text_px_height + vert_offset), pygame.SRCALPHA)
-
-            for line_nr, line in enumerate(self.lines):
-                line_surf = self.font.render(line.rstrip("\r"), True, self.text_colour)
-                line_rect = line_surf.get_rect()
-                line_rect.top = vert_offset
-                vert_offset += font_height if not line.endswith("\r") else font_height // 2
-                line_rect = alignX(line_rect, self.px_width, self.text_align)
-                self.text_surface.blit(line_surf, line_rect)
+                self.__vert_offset = 0
+            self.__band = None #All lines have to be rendered again
 
             self.updated = False
 
-        if self._moved:
-            #Blit the fully rendered text surface onto a limiter surface.
-            text_limiter = pygame.Surface((self.px_width, self.px_height), pygame.SRCALPHA)
-            text_limiter.blit(self.text_surface, (0, -self.scrolled_px))
-
-            #Blit the text surface onto the actual background
-            self.surface = self.bg_surface.copy()
-            self.surface.blit(text_limiter, self.scaled(self.text_offset))
+        #Only the lines around the visible area are rendered (see __Render_lines), which only have to be rendered again once the visible area moves beyond them.
+        #The visible part of text_surface is selected when drawing (see get_blits).
+        top = self.scrolled_px
+        bottom = min(top + self.px_height, self.__vert_offset + self.text_px_height)
+        if not self.__band or not (self.__band[0] <= top and bottom <= self.__band[1]):
+            self.__Render_lines(top)
 
-            if self.scroll_bar:
-                self.scroll_bar.Draw(self.surface, tuple(round(i) for i in self.relative(self.scroll_bar.scaled(self.scroll_bar.topleft))))
-            self._moved = False
+        if self.scroll_bar:
+            self.scroll_bar.Render()
+        self._moved = False
 
-        screen.blit(self.surface, pos)
-        return
+    def __Render_lines(self, scrolled_px):
+        """
+        Renders all lines within (or close to) the visible area onto self.text_surface.
+        Besides the visible area, the surface also contains the lines up to px_height above and below it, so scrolling a little does not require any lines to be rendered.
+        Which lines are visible is found using the stored position of every line, so the work (and the size of the surface) does not depend on the total amount of text.
+        """
+        vert_offset = self.__vert_offset
+        top = max(0, scrolled_px - self.px_height)
+        bottom = min(vert_offset + self.text_px_height, scrolled_px + 2 * self.px_height)
+        self.__band = (top, bottom)
+        self.text_surface = self._display_format(pygame.Surface((self.px_width, max(0, bottom - top)), pygame.SRCALPHA))
+
+        lines = self.__lines
+        line_tops = self.__line_tops
+        head = self.__head
+        base = line_tops[head] - vert_offset + top #Line tops are stored relative to the first line ever built, even if older lines have been dropped since.
+        #Start two lines early, as lines ending in \r only take up half a line, so the line above them could still reach into the area.
+        for line_nr in range(max(head, bisect_right(line_tops, base, head) - 2), len(lines)):
+            line_top = line_tops[line_nr] - base
+            if line_top >= bottom - top:
+                break
+            line = lines[line_nr]
+            line_surf = self.Make_text_surface(line.rstrip("\r"), self.text_colour)
+            line_rect = line_surf.get_rect()
+            line_rect.top = line_top
+            line_rect = alignX(line_rect, self.px_width, self.text_align)
+            self.text_surface.blit(line_surf, line_rect)
+
+    def get_blits(self, pos = None):
+        pos = pos or self.scaled(self.topleft)
+        #Draw the background, and the visible part of the fully rendered text surface on top of it
+        blits = [(self.bg_surface, pos), (self.text_surface, self.offset(pos, self.scaled(self.text_offset)), pygame.Rect(0, self.scrolled_px - self.__band[0], self.px_width, self.px_height))]
+        if self.scroll_bar:
+            blits.extend(self.scroll_bar.get_blits(self.offset(pos, tuple(round(i) for i in self.relative(self.scroll_bar.scaled(self.scroll_bar.topleft))))))
+        return blits
 
 
     def write(self, value):
         """
         Append value to self.text.
         Allows for a Text object to be used as an output "file" for e.g. print.
+        Unlike setting self.text, the existing lines are kept. Only the last line and the new text are wrapped again when the Text is next drawn.
         """
-        self.text += value
+        if Buttons.validate and not isinstance(value, str):
+            raise TypeError(f"Text should be type str, not type {type(value).__name__}.")
+
+        self.__tail += value
+        self.updated = True
 
     @property
     def scrolled(self):
@@ -279,20 +311,29 @@ class Text(ButtonBase):
 
     @property
     def text(self):
-        return self.__text
+        #The text is stored as all complete paragraphs (lines of text up to and including their newline), followed by the text that has not been split into paragraphs yet.
+        return "".join(chunk for chunk, line_count in self.__paragraphs) + self.__tail
 
     @text.setter
     def text(self, value):
-        if not isinstance(value, str):
+        if Buttons.validate and not isinstance(value, str):
             raise TypeError(f"Text should be type str, not type {type(value).__name__}.")
 
-        self.__text = value
+        #The text was replaced, so all lines have to be re-built
+        self.__paragraphs = () #Only becomes a deque once it holds any paragraphs, as even an empty deque takes over half a kB.
+        self.__paragraph_chars = 0
+        self.__tail = value
+        self.__tail_lines = 0
+        self.__lines = []
+        self.__line_tops = []
+        self.__head = 0
+        self.__wrapped = None
         self.updated = True
 
 
     @property
     def lines(self):
-        return self.__lines
+        return tuple(self.__lines[self.__head:])
 
     @lines.setter
     def lines(self, value):
@@ -300,10 +341,29 @@ class Text(ButtonBase):
 
         """
         #For external use only. Internally, all writing calls are directly to self.__lines
-        if not isinstance(value, (tuple, list,)):
+        if Buttons.validate and not isinstance(value, (tuple, list,)):
             raise TypeError(f"Lines must be type 'tuple' or type 'list', not type {type(value).__name__}")
-        self.__lines = tuple(value)
-        self.__text = "\n".join(self.__lines)
+        self.text = "\n".join(value)
+
+
+    @property
+    def max_lines(self):
+        return self.__max_lines
+    @max_lines.setter
+    def max_lines(self, value):
+        if Buttons.validate and value is not None and (not isinstance(value, int) or value < 1):
+            raise ValueError(f"max_lines must be None or an int >= 1, not {repr(value)}")
+        self.__max_lines = value
+        self.updated = True
+
+    @property
+    def max_chars(self):
+        return self.__max_chars
+    @max_chars.setter
+    def max_chars(self, value):
+        if Buttons.validate and value is not None and (not isinstance(value, int) or value < 1):
+            raise ValueError(f"max_chars must be None or an int >= 1, not {repr(value)}")
+        self.__max_chars = value
         self.updated = True
 
     @property
@@ -320,35 +380,156 @@ class Text(ButtonBase):
         """
         (Re-)builds the '*.lines' tuple based on the current value of self.text, such that the text will automatically wrap around to the next line if it won't fit on the current line anymore.
         Called automatically in *.Draw, after *.text is set / changed.
+        If text was only appended (see *.write) since the lines were last built, only the last paragraph of the old text is wrapped again (together with the new text).
+        Afterwards, the oldest paragraphs are dropped if required by max_lines and max_chars.
         """
         max_width = self.px_width
         font_height = self.font.get_height()
-        #Split the text into lines, ignoring any trailing newlines.
+        lines = self.__lines
+        line_tops = self.__line_tops
+        paragraphs = self.__paragraphs
+        key = (self.font, max_width)
+        if self.__wrapped == key:
+            #Paragraphs can only change when text is added to them, so only the last paragraph (and all new ones) have to be wrapped again.
+            del lines[len(lines) - self.__tail_lines:]
+            del line_tops[len(lines):]
+        else:
+            #Wrap all (kept) paragraphs again
+            lines.clear()
+            line_tops.clear()
+            self.__head = 0
+            for paragraph in paragraphs:
+                paragraph[1] = self.__Add_lines(self.__wrap_paragraph(paragraph[0].rstrip("\n"), max_width), font_height)
+            self.__wrapped = key
+
+        #Split the new text into paragraphs, ignoring any trailing newlines.
         #\r is turned into \r\n to make sure only one \r is on each line, and it actually ends the line too.
-        text_lines = self.text.replace("\r", "\r\n").rstrip("\n\r").split("\n")
-        lines = []
-        for line in text_lines:
-            words = line.replace("\t", 4*" ").split(" ")
-            line_string = words[0]
-            for word in words[1:]:
-                if self.font.size(" ".join([line_string, word]))[0] <= max_width or not word: #If the next word still fits on this line:
-                    #This also absorbs any trailing spaces, such that they won't spill over into the next line
-                    line_string = " ".join([line_string, word]) #Join it together with the existing text
-                else: #If the word is too long to fit on the line:
-                    lines.append(line_string.rstrip(" "))
-                    line_string = word #Place it on the next line.
-            #Once all words are exhausted, append the remaining string to lines as well
-            lines.append(line_string.rstrip(" "))
-        self.__lines = tuple(lines)
+        text = self.__tail.rstrip("\n\r")
+        last_start = max(text.rfind("\n"), text.rfind("\r")) + 1
+        new_paragraphs = text[:last_start].replace("\r", "\r\n").split("\n")[:-1]
+        self.__tail = self.__tail[last_start:] #The last paragraph (and any trailing newlines) can still be added to, so it is kept apart.
+
+        #Paragraphs that would be dropped straight away (see max_lines and max_chars) are not wrapped at all. Every paragraph takes at least one line.
+        first = max(0, len(new_paragraphs) - self.max_lines + 1) if self.max_lines else 0
+        if self.max_chars:
+            chars = len(self.__tail)
+            kept = len(new_paragraphs)
+            while kept > first and chars + len(new_paragraphs[kept - 1]) + (not new_paragraphs[kept - 1].endswith("\r")) <= self.max_chars:
+                kept -= 1
+                chars += len(new_paragraphs[kept]) + (not new_paragraphs[kept].endswith("\r"))
+            first = kept
+        if first:
+            #All older paragraphs are dropped as well
+            paragraphs = self.__paragraphs = ()
+            self.__paragraph_chars = 0
+            self.__head = len(lines)
+        if not paragraphs and first < len(new_paragraphs):
+            paragraphs = self.__paragraphs = deque()
+        for paragraph in new_paragraphs[first:]:
+            #Store the paragraph as the original text (ending with \r, or with the \n that ended it)
+            chunk = paragraph if paragraph.endswith("\r") else paragraph + "\n"
+            paragraphs.append([chunk, self.__Add_lines(self.__wrap_paragraph(paragraph, max_width), font_height)])
+            self.__paragraph_chars += len(chunk)
+        self.__tail_lines = self.__Add_lines(self.__wrap_paragraph(text[last_start:], max_width), font_height)
+
+        #Drop the oldest paragraphs until the text fits within max_lines and max_chars. The last paragraph is always kept.
+        while paragraphs and ((self.max_lines and len(lines) - self.__head > self.max_lines) or (self.max_chars and self.__paragraph_chars + len(self.__tail) > self.max_chars)):
+            chunk, line_count = paragraphs.popleft()
+            self.__paragraph_chars -= len(chunk)
+            self.__head += line_count
+        #Only actually remove the dropped lines once they take up at least half of the lists, so dropping lines takes O(1) time on average.
+        if self.__head > len(lines) // 2:
+            del lines[:self.__head]
+            del line_tops[:self.__head]
+            self.__head = 0
 
         # Conditional part to account for text sometimes being larger than the font size
-        self.text_px_height = len(self.lines) * font_height - self.text.rstrip("\n\r").count("\r") * math.ceil(font_height / 2) + (self.font.size(self.lines[-1])[1] - font_height if self.lines else 0)
+        last_line = lines[-1]
+        self.text_px_height = line_tops[-1] - line_tops[self.__head] + (font_height if not last_line.endswith("\r") else font_height // 2) + self.metrics.size(last_line)[1] - font_height
 
         if self.scroll_bar:
             self.scroll_bar.Set_slider_primary(round(self.scroll_bar.height * min(1, (self.height - 2 * self.text_offset[1]) / self.text_px_height)))
 
         self.scrolled += 0 #Update the 'scrolled' value, to take into account that after rebuilding, the length of 'lines' might be different
 
+    def __Add_lines(self, new_lines, font_height):
+        """
+        Adds the given lines after all current lines, storing the vertical position (in px) of each of them, so the visible lines can be found quickly when rendering.
+        Returns the amount of lines added.
+        """
+        lines = self.__lines
+        line_tops = self.__line_tops
+        y = line_tops[-1] + (font_height if not lines[-1].endswith("\r") else font_height // 2) if lines else 0
+        for line in new_lines:
+            lines.append(line)
+            line_tops.append(y)
+            y += font_height if not line.endswith("\r") else font_height // 2
+        return len(new_lines)
+
+    def __wrap_paragraph(self, paragraph, max_width):
+        """
+        Splits a single paragraph (a line of text without newlines) into lines which fit within max_width px, wrapping at spaces.
+        Words are added to a line until the next (non-empty) word does not fit anymore. Words which are wider than max_width by themselves are not split up.
+        The break is first estimated by adding up the (cached) widths of the words, and then confirmed by measuring the line, searching outwards from the estimate.
+        This way, every line only has to be measured a few times, instead of once for every word on it.
+        """
+        metrics = self.metrics
+        words = paragraph.replace("\t", 4*" ").split(" ")
+        count = len(words)
+        font = metrics.font
+        word_width = metrics.word_width
+        space_width = word_width(" ")
+        def too_wide(start, end):
+            #Returns whether the line from words[start] up to and including words[end] is too wide. Lines are measured directly, as they are hardly ever measured twice.
+            return font.size(" ".join(words[start:end + 1]))[0] > max_width
+        lines = []
+        start = 0
+        while start < count:
+            #Estimate the first word which makes the line too wide
+            end = start + 1
+            width = word_width(words[start])
+            while end < count:
+                width += space_width + word_width(words[end])
+                if width > max_width:
+                    break
+                end += 1
+            #Confirm the estimate by measuring the actual line. Search outwards from the estimate until the first word that makes the line too wide lies between two measured words, then bisect.
+            #(A single word always stays on the line, even if it is too wide by itself.)
+            if end < count or (end > start + 1 and too_wide(start, count - 1)):
+                guess = min(end, count - 1)
+                if too_wide(start, guess):
+                    high = guess
+                    step = 1
+                    low = guess - step
+                    while low > start and too_wide(start, low):
+                        high = low
+                        step *= 2
+                        low = high - step
+                    low = max(low, start)
+                else:
+                    low = guess
+                    step = 1
+                    high = guess + step
+                    while high < count and not too_wide(start, high):
+                        low = high
+                        step *= 2
+                        high = low + step
+                    high = min(high, count)
+                #Now, the line up to words[low] fits (or low == start), and the line up to words[high] is too wide (or high == count)
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if too_wide(start, middle):
+                        high = middle
+                    else:
+                        low = middle
+                end = high
+            #Empty words (from multiple spaces) are always added, such that trailing spaces won't spill over into the next line
+            while end < count and not words[end]:
+                end += 1
+            lines.append(" ".join(words[start:end]).rstrip(" "))
+            start = end
+        return lines
+
     @property
     def px_width(self):
         """
@@ -5,6 +5,7 @@ from .utils import alignX, alignY
 import os
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = ""
 import pygame
+import math
 
 
 class TextBox(ButtonBase):
@@ -45,6 +46,7 @@ class TextBox(ButtonBase):
 
     *.is_selected: bool - Whether this TextBox object is selected at this point in time. I.E. Whether the user is currently typing in this TextBox.
     """
+    __slots__ = ("__cursor", "__deselected", "__is_selected", "__new_input", "__text_align", "__text_scroll", "__value", "accent_bg", "accent_border", "bg", "border", "cursor_animation", "cursor_surface", "hint", "hint_colour", "selected", "text_offset")
     actions = ["LMB_down", "Key_down"]
     def __init__(self, pos, size,
                  hint = "",
@@ -102,7 +104,7 @@ class TextBox(ButtonBase):
         self.__is_selected = False
         self.deselected = False
         self.functions = functions
-        self.Draw(pygame.Surface((1, 1))) #Makes sure all attributes are set-up correctly
+        self.Render() #Makes sure all attributes are set-up correctly
 
 
     def LMB_down(self, pos):
@@ -112,21 +114,19 @@ class TextBox(ButtonBase):
                 pos = self.relative(pos)
                 #If there is any text: (Check required since for loop has to run at least once to not crash)
                 if self._text:
-                    #Iterate over all letters, to find which letter was closest to
-                    #the position at which the user clicked
-                    text_width = self.font.size(self._text)[0]
+                    #Find which letter was closest to the position at which the user clicked
+                    text_width = self.metrics.width(self._text)
                     if text_width < self.true_width - 2 * self.scaled(self.text_offset[0]):
                         pixel_offset = alignX(text_width, self.true_width - 2 * self.scaled(self.text_offset[0]) - 1, self.text_align).left + self.scaled(self.text_offset[0])
                     else:
                         pixel_offset = - self.text_scroll + self.scaled(self.text_offset[0])
-                    for letter_nr, letter in enumerate(self._text):
-                        pixel_length = self.font.size(self._text[:letter_nr + 1])[0]
-                        if (pixel_length + pixel_offset) >= pos[0]:
-                            break
+                    letter_nr = self.metrics.index_at(self._text, pos[0] - pixel_offset)
+                    letter = self._text[letter_nr]
+                    pixel_length = self.metrics.width(self._text[:letter_nr + 1])
                     #Calculate the horizontal distance from the cursor to the text box
                     distance = pixel_length + pixel_offset - pos[0]
                     #Get the size of the last letter in the list
-                    letter_size = self.font.size(letter)[0]
+                    letter_size = self.metrics.width(letter)
                     #If the cursor is more than halfway back before the end of this letter
                     #put the cursor in front of the letter.
                     if distance >= (0.5 * letter_size):
@@ -197,34 +197,24 @@ class TextBox(ButtonBase):
         # Lock is automatically released in is_selected property setter
 
 
-    def Draw(self, screen, pos = None):
+    def Render(self):
         """
-        Draw the button to the screen.
+        Re-builds the surfaces of the TextBox, if required, and advances the cursor animation.
         """
-        pos = pos or self.scaled(self.topleft)
         if self.updated:
             self.update_scroll()
-            #Draw the correct background onto the surface
+            #Draw the correct background onto the surface, with the border and accent border (if they are enabled)
             if not self._is_selected:
-                self.surface = self.Make_background_surface(self.bg)
+                self.surface = self.Make_background(self.bg, self.border)
             else:
-                self.surface = self.Make_background_surface(self.accent_bg)
-            #Draw a border, if it is enabled
-            if self.border:
-                self.Draw_border(self.surface, *self.border)
-            #Draw a accent border, if it is enabled:
-            if self.accent_border and self._is_selected:
-                self.Draw_border(self.surface, *self.accent_border)
-            #Copy the surface to allow the cursor to be drawn
-            self.cursor_surface = self.surface.copy()
+                self.surface = self.Make_background(self.accent_bg, self.border, self.accent_border)
 
-            #Add the text to the surface
-            text_limiter = pygame.Surface(self.offset(self.true_size, self.scaled(self.text_offset), (-2, -2)), pygame.SRCALPHA)
-            limiter_rect = text_limiter.get_rect()
+            #Add the text to the surface, within the area inside of the border
+            limiter_rect = pygame.Rect((0, 0), self.Clamp(self.offset(self.true_size, self.scaled(self.text_offset), (-2, -2)), 0, math.inf))
             if self._text:
-                text_surface = self.font.render(self._text, True, self.text_colour)
+                text_surface = self.Make_text_surface(self._text, self.text_colour)
             else:
-                text_surface = self.font.render(self.hint, True, self.hint_colour)
+                text_surface = self.Make_text_surface(self.hint, self.hint_colour)
             #Align the text rect
             text_rect = alignY(self.font.get_height(), limiter_rect, self.text_align)
             text_rect.width = text_surface.get_width()
@@ -235,20 +225,24 @@ class TextBox(ButtonBase):
             else:
                 #If the text is wider than the limiter, all alignment is taken care of inside text_scroll
                 text_rect.left = - self.text_scroll
-            text_limiter.blit(text_surface, text_rect)
-            #Blit the limiter onto the button
+            #Blit the text onto the button, cutting it off at the edges of the limiter area
             limiter_rect.center = self.middle #middle is scaled(width / 2, height / 2)
-            self.surface.blit(text_limiter, limiter_rect)
+            self.surface.set_clip(limiter_rect)
+            self.surface.blit(text_surface, text_rect.move(limiter_rect.topleft))
+            self.surface.set_clip(None)
+            #Copy the surface to allow the cursor to be drawn
+            self.cursor_surface = self.surface.copy()
 
             #Make the cursor surface
             cursor_rect = pygame.Rect((0, 0), (max(1, self.scaled(1)), self.font.get_height()))
             #Align cursor vertically
             cursor_rect.centery = text_rect.centery
             #Align cursor horizontally. (if-else statement is required to prevent the hint from changing the Cursor location.)
-            cursor_rect.left = self.font.size(self._text[:self.cursor])[0] + (text_rect.left if self._text else alignX(cursor_rect.width, limiter_rect, self.text_align).left)
-            #Draw the cursor to the text limiter
-            pygame.draw.rect(text_limiter, self.text_colour,  cursor_rect)
-            self.cursor_surface.blit(text_limiter, limiter_rect)
+            cursor_rect.left = self.metrics.width(self._text[:self.cursor]) + (text_rect.left if self._text else alignX(cursor_rect.width, limiter_rect, self.text_align).left)
+            #Draw the cursor onto the cursor surface (within the limiter area)
+            self.cursor_surface.set_clip(limiter_rect)
+            pygame.draw.rect(self.cursor_surface, self.text_colour, cursor_rect.move(limiter_rect.topleft))
+            self.cursor_surface.set_clip(None)
 
             #Clear self.updated again, as the surface has been remade.
             self.updated = False
@@ -256,11 +250,13 @@ class TextBox(ButtonBase):
         if self._is_selected:
             #Update the cursor animation
             self.cursor_animation = (self.cursor_animation + 1) % Buttons.framerate
+
+    def get_blits(self, pos = None):
+        pos = pos or self.scaled(self.topleft)
         if self.cursor_animation < Buttons.framerate // 2:
-            screen.blit(self.cursor_surface, pos)
+            return [(self.cursor_surface, pos)]
         else:
-            screen.blit(self.surface, pos)
-        return
+            return [(self.surface, pos)]
 
     @property
     def is_selected(self):
@@ -382,11 +378,11 @@ class TextBox(ButtonBase):
         """
         #Get the width of the text box; +1 to account for a possible cursor at the end.
         #Always add this +1, to prevent annoying 1-pixel shifts when moving the cursor to the final position.
-        text_width = self.font.size(self._text)[0] + 1
+        text_width = self.metrics.width(self._text) + 1
         #Get the width of the text limiter surface
         limiter_width = self.true_width - self.scaled(2 * self.text_offset[0])
         #Get the cursor pixel index; +1 not required since 'size' already includes index 0 as width 1
-        cursor_pos = self.font.size(self._text[:self.cursor])[0]
+        cursor_pos = self.metrics.width(self._text[:self.cursor])
         #If all text fits in the view window:
         if text_width <= limiter_width:
             #Reset any scroll. No need to scroll if it fits anyway
@@ -0,0 +1,111 @@
+from .LRUCache import LRUCache
+
+
+class FontMetrics():
+    """
+    Caches measurements of text for a single pygame.font.Font, to prevent measuring the same (sub)strings over and over again.
+
+    Exact sizes (*.size) are memoised per string. A table of the advance (width) of each individual character (*.advance) is built from Font.metrics.
+    As the advances do not include kerning, they are only used to estimate widths, which are then confirmed with exact sizes where required.
+    The widths of single words (*.word_width) are kept in a separate, larger cache, as wrapping text measures many different words, which should not push out other sizes.
+
+    font: pygame.font.Font - The font to measure text with.
+    maxsize: int - The maximum amount of exact sizes that are remembered.
+    word_maxsize: int - The maximum amount of word widths that are remembered.
+    """
+    def __init__(self, font, maxsize = 1024, word_maxsize = 8192):
+        self.font = font
+        self.__sizes = LRUCache(maxsize)
+        self.word_maxsize = word_maxsize
+        self.__words = {}
+        self.__advances = {}
+
+    def size(self, text):
+        """
+        Returns the exact (width, height) of the given text, like pygame.font.Font.size.
+        """
+        size = self.__sizes.get(text)
+        if size is None:
+            size = self.font.size(text)
+            self.__sizes.set(text, size)
+        return size
+
+    def width(self, text):
+        """
+        Returns the exact width of the given text.
+        """
+        return self.size(text)[0]
+
+    def word_width(self, word):
+        """
+        Returns the exact width of a single word (or any other short string).
+        Adding up the widths of words (and spaces) gives a close estimate of the width of the text they form together, but not an exact one due to kerning and rounding.
+        """
+        width = self.__words.get(word)
+        if width is None:
+            #Words are looked up very often while wrapping, so a plain dict is used (which is simply cleared when it is full), instead of an LRUCache.
+            if len(self.__words) >= self.word_maxsize:
+                self.__words.clear()
+            width = self.__words[word] = self.font.size(word)[0]
+        return width
+
+    def advance(self, char):
+        """
+        Returns the horizontal advance of a single character, without taking kerning into account.
+        """
+        advance = self.__advances.get(char)
+        if advance is None:
+            metrics = self.font.metrics(char)[0]
+            #Characters which are not part of the font do not have metrics, so they are measured directly instead.
+            advance = metrics[4] if metrics else self.font.size(char)[0]
+            self.__advances[char] = advance
+        return advance
+
+    def estimate(self, text):
+        """
+        Returns an estimate of the width of the given text, based only on the advances of its characters.
+        """
+        return sum(self.advance(char) for char in text)
+
+    def index_at(self, text, x):
+        """
+        Returns the index of the first character in text whose right side lies at or beyond x (in px from the start of the text).
+        If no such character exists, returns the index of the last character (or 0 if text is empty).
+        Gives the same result as measuring text[:i + 1] for every i, but only requires a few exact measurements.
+        """
+        if not text:
+            return 0
+        #Find the estimated index using only the advance table
+        guess = 0
+        estimate = 0
+        for guess, char in enumerate(text):
+            estimate += self.advance(char)
+            if estimate >= x:
+                break
+        #Confirm the guess with exact sizes: search outwards from the guess until the answer lies between two measured indices, then bisect.
+        if self.width(text[:guess + 1]) >= x:
+            high = guess
+            step = 1
+            low = guess - step
+            while low >= 0 and self.width(text[:low + 1]) >= x:
+                high = low
+                step *= 2
+                low = high - step
+            low = max(low, -1)
+        else:
+            low = guess
+            step = 1
+            high = guess + step
+            while high < len(text) and self.width(text[:high + 1]) < x:
+                low = high
+                step *= 2
+                high = low + step
+            high = min(high, len(text))
+        #Now, text[:low + 1] is too short (or low == -1), and text[:high + 1] is long enough (or high == len(text))
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.width(text[:middle + 1]) >= x:
+                high = middle
+            else:
+                low = middle
+        return min(high, len(text) - 1)
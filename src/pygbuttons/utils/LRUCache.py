@@ -0,0 +1,62 @@
+class LRUCache():
+    """
+    A cache holding at most maxsize items. When it is full, the least recently used item is evicted to make space for a new one.
+
+    maxsize: int - The maximum amount of items stored in the cache.
+
+    Attributes:
+    *.hits, *.misses: int - The amount of times get found / did not find the requested item. Can be used to tune maxsize.
+    """
+    def __init__(self, maxsize = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__items = {} #Dicts remember their insertion order, so the first item is always the least recently used one.
+
+    def __contains__(self, key):
+        return key in self.__items
+
+    def __len__(self):
+        return len(self.__items)
+
+    def get(self, key, default = None):
+        """
+        Returns the item stored under key, or default if it is not present. Marks the item as most recently used.
+        """
+        try:
+            value = self.__items.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.__items[key] = value
+        return value
+
+    def set(self, key, value):
+        """
+        Store an item under key, evicting the least recently used items if the cache is full.
+        """
+        self.__items.pop(key, None)
+        self.__items[key] = value
+        while len(self.__items) > self.maxsize:
+            del self.__items[next(iter(self.__items))]
+
+    def keys(self):
+        """
+        Returns a list of all keys in the cache, from the least to the most recently used one.
+        """
+        return list(self.__items)
+
+    def remove(self, key):
+        """
+        Remove the item stored under key from the cache. Does nothing if it is not present.
+        """
+        self.__items.pop(key, None)
+
+    def clear(self):
+        """
+        Remove all items from the cache, and reset the hits and misses.
+        """
+        self.__items.clear()
+        self.hits = 0
+        self.misses = 0
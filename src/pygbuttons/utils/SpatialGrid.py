@@ -0,0 +1,123 @@
+import math
+import weakref
+
+
+class SpatialGrid():
+    """
+    A uniform grid used to quickly find which items (e.g. Buttons) lie underneath a certain position.
+
+    Every item is stored with its rectangle (left, top, right, bottom) in every grid cell this rectangle overlaps.
+    Finding all items at a position then only requires the items within a single cell to be checked, instead of all items.
+
+    cell_size: int - The size (in px) of the (square) cells of the grid.
+    weak: bool - If True, the grid only keeps weak references to its items. Items which are garbage collected are removed from the grid automatically.
+    """
+    def __init__(self, cell_size = 128, weak = False):
+        self.cell_size = cell_size
+        self.weak = weak
+        self.__cells = {} #Maps the (x, y) index of a cell onto a dict (used as an ordered set) of the (keys of the) items inside of it.
+        self.__items = {} #Maps the key of every item onto a tuple of its (rect, cell range, key). The key is the item itself, or a weakref to it.
+
+    def __contains__(self, item):
+        return self.__key(item) in self.__items
+
+    def __len__(self):
+        return len(self.__items)
+
+    def __iter__(self):
+        #Iterates over a snapshot, as garbage collection can remove items from a weak grid at any time.
+        for key in list(self.__items):
+            item = key() if self.weak else key
+            if item is not None:
+                yield item
+
+    def insert(self, item, rect):
+        """
+        Add an item to the grid, or update its rectangle if it is already present.
+
+        item: * - Any hashable object.
+        rect: (left, top, right, bottom) - The area covered by the item. The right and bottom edges are exclusive.
+        """
+        cells = self.__cell_range(rect)
+        old = self.__items.get(self.__key(item))
+        if old is not None:
+            key = old[2]
+        else:
+            #Weakrefs to dead items only compare equal to themselves, so the same weakref (with the callback that removes the item) has to be used everywhere.
+            key = weakref.ref(item, self.__remove_dead) if self.weak else item
+        self.__items[key] = (rect, cells, key)
+        #If the item still covers exactly the same cells, updating the stored rect is enough.
+        if old is not None:
+            if old[1] == cells:
+                return
+            self.__remove_from_cells(key, old[1])
+        left, top, right, bottom = cells
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                self.__cells.setdefault((x, y), {})[key] = None
+
+    def remove(self, item):
+        """
+        Remove an item from the grid. Does nothing if the item is not present.
+        """
+        old = self.__items.pop(self.__key(item), None)
+        if old is not None:
+            self.__remove_from_cells(old[2], old[1])
+
+    def query(self, pos):
+        """
+        Returns a list of all items whose rectangle contains the given position.
+        """
+        x, y = pos
+        cell = self.__cells.get((math.floor(x / self.cell_size), math.floor(y / self.cell_size)))
+        if not cell:
+            return []
+        items = self.__items
+        output = []
+        for key in cell:
+            left, top, right, bottom = items[key][0]
+            #Just like ButtonBase.contains, the left and top edges are inclusive, while the right and bottom edges are exclusive.
+            if left <= x < right and top <= y < bottom:
+                item = key() if self.weak else key
+                if item is not None:
+                    output.append(item)
+        return output
+
+    def clear(self):
+        """
+        Remove all items from the grid.
+        """
+        self.__cells.clear()
+        self.__items.clear()
+
+    def __cell_range(self, rect):
+        """
+        Returns the (first x, first y, last x, last y) indices of the cells covered by the given rect.
+        """
+        left, top, right, bottom = rect
+        size = self.cell_size
+        #Empty rects are still stored in the cell they are positioned in, but can never contain a position.
+        return (math.floor(left / size), math.floor(top / size), math.floor((max(left, right - 1)) / size), math.floor((max(top, bottom - 1)) / size))
+
+    def __key(self, item):
+        """
+        Returns the key under which an item is stored.
+        """
+        return weakref.ref(item) if self.weak else item
+
+    def __remove_dead(self, key):
+        """
+        Called when an item of a weak grid has been garbage collected.
+        """
+        old = self.__items.pop(key, None)
+        if old is not None:
+            self.__remove_from_cells(key, old[1])
+
+    def __remove_from_cells(self, item, cells):
+        left, top, right, bottom = cells
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = self.__cells[(x, y)]
+                del cell[item]
+                if not cell:
+                    del self.__cells[(x, y)]
@@ -1,15 +1,56 @@
 from weakref import WeakValueDictionary
 from functools import wraps
+from threading import RLock
+
+from .LRUCache import LRUCache
+
+def weak_cache(func = None, *, maxsize = 64):
+    """
+    Caches the results of a function based on its (hashable) arguments.
+    Results are kept for as long as they are still in use elsewhere. On top of that, the maxsize most recently used results are always kept alive, so results which are only briefly unused (e.g. fonts during zooming) do not have to be re-made.
+    Can be used both as @weak_cache and as @weak_cache(maxsize = ...).
+
+    The wrapped function also provides:
+    *.cache_info() - Returns a dict with the amount of cache hits and misses, and the amount of results currently stored.
+    *.cache_clear() - Removes all results from the cache, and resets the statistics.
+    *.prewarm(args_list) - Calls the function for every tuple of arguments in args_list, storing the results. Returns the list of results.
+    """
+    if func is None:
+        return lambda func: weak_cache(func, maxsize = maxsize)
 
-def weak_cache(func):
     cache = WeakValueDictionary()
+    strong = LRUCache(maxsize) #Keeps the most recently used results alive, even when they are not used anywhere else.
+    lock = RLock()
+    stats = {"hits": 0, "misses": 0}
     sentinel = object()
+    @wraps(func)
     def wrapper(*args):
         key = args
-        result = cache.get(key, sentinel)
-        if result is not sentinel:
+        with lock:
+            result = cache.get(key, sentinel)
+            if result is not sentinel:
+                stats["hits"] += 1
+            else:
+                stats["misses"] += 1
+                result = func(*args)
+                cache[key] = result
+            strong.set(key, result)
             return result
-        result = func(*args)
-        cache[key] = result
-        return result
+
+    def cache_info():
+        with lock:
+            return {"hits": stats["hits"], "misses": stats["misses"], "size": len(cache), "strong_size": len(strong), "maxsize": strong.maxsize}
+
+    def cache_clear():
+        with lock:
+            cache.clear()
+            strong.clear()
+            stats["hits"] = stats["misses"] = 0
+
+    def prewarm(args_list):
+        return [wrapper(*args) for args in args_list]
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    wrapper.prewarm = prewarm
     return wrapper
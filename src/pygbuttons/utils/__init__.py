@@ -1,7 +1,10 @@
-__all__ = ["weak_cache", "align", "alignX", "alignY"]
+__all__ = ["weak_cache", "align", "alignX", "alignY", "SpatialGrid", "LRUCache", "FontMetrics"]
 
 from .WeakCache import weak_cache
 from .alignment import align, alignX, alignY
+from .SpatialGrid import SpatialGrid
+from .LRUCache import LRUCache
+from .FontMetrics import FontMetrics
 
 # clamp x2
 # align
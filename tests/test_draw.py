@@ -0,0 +1,41 @@
+import os
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = ""
+
+import pygame
+import pytest
+
+from pygbuttons import Buttons, Button
+
+
+class Badge(Button):
+    """
+    A Button which only overrides Draw, to draw a red square on top of itself.
+    """
+    def Draw(self, screen, pos = None):
+        super().Draw(screen, pos)
+        pygame.draw.rect(screen, (255, 0, 0), (self.get_scaled_rect().topleft, (10, 10)))
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    yield pygame.display.set_mode((200, 200))
+    for button in list(Buttons._index):
+        button.Delete()
+
+
+@pytest.mark.parametrize("options", [{}, {"dirty_rects": True}, {"layered": True}, {"layered": True, "dirty_rects": True}])
+def test_subclass_draw_is_called(screen, options):
+    badge = Badge((20, 20), (100, 40), text = "Badge", group = "badge")
+    for _ in range(2):
+        screen.fill((0, 0, 0))
+        rects = Buttons.Draw(screen, "badge", **options)
+        assert screen.get_at((25, 25))[:3] == (255, 0, 0)
+        if options.get("dirty_rects"):
+            assert any(rect.collidepoint(25, 25) for rect in rects)
+
+
+def test_plain_button_is_batched(screen):
+    assert not Buttons._draws_itself(Button((0, 0), (10, 10)))
+    assert Buttons._draws_itself(Badge((0, 0), (10, 10)))